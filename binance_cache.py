@@ -0,0 +1,42 @@
+# binance_cache.py
+"""Short-lived Redis cache for idempotent Binance REST reads"""
+import json
+import logging
+from functools import lru_cache
+
+import redis
+
+from config import get_config
+
+TICKER_TTL = 2
+
+logger = logging.getLogger('BinanceCache')
+
+
+@lru_cache(maxsize=1)
+def _redis():
+    return redis.Redis.from_url(get_config().REDIS_URL, socket_timeout=0.2)
+
+
+def _cached(key, ttl, fetch):
+    """Return the cached JSON value for key, calling fetch() and storing it on a miss"""
+    try:
+        hit = _redis().get(key)
+        if hit is not None:
+            return json.loads(hit)
+    except redis.RedisError as e:
+        logger.warning(f"Redis unavailable, calling Binance directly: {e}")
+        return fetch()
+
+    value = fetch()
+    try:
+        _redis().setex(key, ttl, json.dumps(value))
+    except redis.RedisError as e:
+        logger.warning(f"Could not cache {key}: {e}")
+    return value
+
+
+def cached_ticker(client, symbol):
+    return _cached(f'binance:ticker:{symbol}', TICKER_TTL,
+                   lambda: client.get_symbol_ticker(symbol=symbol))
+
@@ -0,0 +1,21 @@
+# binance_client.py
+"""Process-wide Binance client with a pooled keep-alive HTTP session"""
+from functools import lru_cache
+
+from binance.client import Client
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import get_config
+
+
+@lru_cache(maxsize=1)
+def get_client() -> Client:
+    cfg = get_config()
+    client = Client(cfg.BINANCE_API_KEY, cfg.BINANCE_API_SECRET, testnet=True)
+    # ensure API URL for python-binance compatibility
+    client.API_URL = cfg.TESTNET_API_URL
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                          max_retries=Retry(total=3, backoff_factor=0.1))
+    client.session.mount('https://', adapter)
+    return client
@@ -1,20 +1,23 @@
 # check_status.py
+import sys
 import time
-from config import Config
-from multi_bot_manager import MultiBotManager
+from config import get_config
+from multi_bot_manager import MultiBotManager, ts_to_dt
 
-cfg = Config()
+cfg = get_config()
 mgr = MultiBotManager(cfg)
 mgr.initialize_bots()
 
 # لو البوتات شغّالة من قبل فهنا بنسأل الحالة مباشرة
 stats = mgr.get_all_stats()
-print("=== Bots stats ===")
-for name, s in stats.items():
-    print(name, s)
+lines = ['=== Bots stats ===']
+lines.extend(f'{name} {s}' for name, s in stats.items())
 
 # اطبع آخر أوامر
-orders = mgr.get_all_orders()
-print("\n=== Recent orders (top 10) ===")
-for o in orders[:10]:
-    print(o)
+orders = mgr.get_recent_orders(10)
+lines.append('')
+lines.append('=== Recent orders (top 10) ===')
+lines.extend(f"{ts_to_dt(o['timestamp_ns']):%Y-%m-%d %H:%M:%S} {o}" for o in orders)
+
+# one write instead of a flush per line (cheaper under `docker logs -f`)
+sys.stdout.write('\n'.join(lines) + '\n')
@@ -0,0 +1,33 @@
+# compile_kernels.py
+"""Ahead-of-time build of the numba kernels into the mina_kernels extension module
+
+Run once at image build time (`python compile_kernels.py`). strategy_kernel and
+volume_kernels import the compiled functions when mina_kernels is importable, so
+the first closed kline / scoring cycle does not pay numba's JIT compile; without
+it they keep their njit (or plain Python) versions.
+"""
+import os
+
+# export the numba functions even if an older mina_kernels build is importable
+os.environ['MINA_NO_AOT'] = '1'
+
+from numba.pycc import CC
+
+import strategy_kernel
+import volume_kernels
+
+cc = CC('mina_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _export(name, signature, dispatcher):
+    cc.export(name, signature)(dispatcher.py_func)  # compile the plain function, not the dispatcher
+
+
+_export('score', 'Tuple((i8, f8, i8))(f8, f8, f8, f8, f8, f8, f8, f8, f8)', strategy_kernel.score)
+_export('volume_score', 'f8(f8[:], f8, f8)', volume_kernels.volume_score)
+_export('is_volume_breakout', 'b1(f8[:], f8[:], f8)', volume_kernels.is_volume_breakout)
+
+
+if __name__ == '__main__':
+    cc.compile()
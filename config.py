@@ -1,48 +1,129 @@
 import os
-from decimal import Decimal
+from dataclasses import dataclass
+from functools import lru_cache
 
+
+def _env_bool(name, default):
+    return os.getenv(name, default).lower() in ('1', 'true', 'yes')
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     # Binance API Configuration
-    BINANCE_API_KEY = os.getenv('BINANCE_API_KEY', '')
-    BINANCE_API_SECRET = os.getenv('BINANCE_API_SECRET', '')
+    BINANCE_API_KEY: str
+    BINANCE_API_SECRET: str
 
     # Environment toggles
-    LIVE = os.getenv('LIVE', 'false').lower() in ('1', 'true', 'yes')  # true => production
-    DRY_RUN = os.getenv('DRY_RUN', 'true').lower() in ('1', 'true', 'yes')  # if true, do not place real orders
+    LIVE: bool  # true => production
+    DRY_RUN: bool  # if true, do not place real orders
 
     # API URLs
-    TESTNET_API_URL = os.getenv('TESTNET_API_URL', 'https://testnet.binance.vision/api')
-    PROD_API_URL = os.getenv('PROD_API_URL', 'https://api.binance.com')
+    TESTNET_API_URL: str
+    PROD_API_URL: str
 
     # Trading Configuration
-    SYMBOL = os.getenv('SYMBOL', 'BTCUSDT')
-    BASE_ASSET = SYMBOL.replace('USDT', '')
-    QUOTE_ASSET = 'USDT'
+    SYMBOL: str
+    BASE_ASSET: str
+    QUOTE_ASSET: str
 
     # Trading Parameters
-    QUANTITY = float(os.getenv('QUANTITY', '0.001'))
-    MAX_POSITION_SIZE = float(os.getenv('MAX_POSITION_SIZE', '0.01'))
-    STOP_LOSS = float(os.getenv('STOP_LOSS', '0.01'))
-    PROFIT_TARGET = float(os.getenv('PROFIT_TARGET', '0.02'))
+    QUANTITY: float
+    MAX_POSITION_SIZE: float
+    STOP_LOSS: float
+    PROFIT_TARGET: float
 
     # Strategy indicators
-    EMA_SHORT = int(os.getenv('EMA_SHORT', '9'))
-    EMA_LONG = int(os.getenv('EMA_LONG', '21'))
-    RSI_PERIOD = int(os.getenv('RSI_PERIOD', '14'))
-    MACD_FAST = int(os.getenv('MACD_FAST', '12'))
-    MACD_SLOW = int(os.getenv('MACD_SLOW', '26'))
-    MACD_SIGNAL = int(os.getenv('MACD_SIGNAL', '9'))
+    EMA_SHORT: int
+    EMA_LONG: int
+    RSI_PERIOD: int
+    MACD_FAST: int
+    MACD_SLOW: int
+    MACD_SIGNAL: int
 
     # Risk controls
-    MAX_DRAWDOWN = float(os.getenv('MAX_DRAWDOWN', '0.05'))
-    DAILY_LOSS_LIMIT = float(os.getenv('DAILY_LOSS_LIMIT', '0.02'))
+    MAX_DRAWDOWN: float
+    DAILY_LOSS_LIMIT: float
+    MAX_ORDER_HISTORY: int  # orders kept in memory per bot
 
     # New Listings & High volume
-    NEW_LISTING_PROFIT_TARGET = float(os.getenv('NEW_LISTING_PROFIT_TARGET', '0.05'))
-    NEW_LISTING_STOP_LOSS = float(os.getenv('NEW_LISTING_STOP_LOSS', '0.03'))
-    VOLUME_SPIKE_THRESHOLD = float(os.getenv('VOLUME_SPIKE_THRESHOLD', '3.0'))
-    SCORE_THRESHOLD = float(os.getenv('SCORE_THRESHOLD', '80'))
+    NEW_LISTING_PROFIT_TARGET: float
+    NEW_LISTING_STOP_LOSS: float
+    VOLUME_SPIKE_THRESHOLD: float
+    SCORE_THRESHOLD: float
+
+    # Logging
+    LOG_LEVEL: str  # DEBUG / INFO / WARNING / ...
+
+    # Dashboard
+    DASHBOARD_HOST: str
+    DASHBOARD_PORT: int
+
+    # Shared cache
+    REDIS_URL: str
+    SOCKETIO_MESSAGE_QUEUE: str  # e.g. the Redis URL; empty => single-process socketio
 
     # Telegram Alerts (optional)
-    TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
-    TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', '')
+    TELEGRAM_BOT_TOKEN: str
+    TELEGRAM_CHAT_ID: str
+
+    @property
+    def strategy_params(self):
+        """(EMA_SHORT, EMA_LONG, MACD_FAST, MACD_SLOW, MACD_SIGNAL, RSI_PERIOD)"""
+        return (self.EMA_SHORT, self.EMA_LONG, self.MACD_FAST,
+                self.MACD_SLOW, self.MACD_SIGNAL, self.RSI_PERIOD)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Parse the environment once and share the resulting Config process-wide"""
+    symbol = os.getenv('SYMBOL', 'BTCUSDT')
+    return Config(
+        BINANCE_API_KEY=os.getenv('BINANCE_API_KEY', ''),
+        BINANCE_API_SECRET=os.getenv('BINANCE_API_SECRET', ''),
+
+        LIVE=_env_bool('LIVE', 'false'),
+        DRY_RUN=_env_bool('DRY_RUN', 'true'),
+
+        TESTNET_API_URL=os.getenv('TESTNET_API_URL', 'https://testnet.binance.vision/api'),
+        PROD_API_URL=os.getenv('PROD_API_URL', 'https://api.binance.com'),
+
+        SYMBOL=symbol,
+        BASE_ASSET=symbol.replace('USDT', ''),
+        QUOTE_ASSET='USDT',
+
+        QUANTITY=float(os.getenv('QUANTITY', '0.001')),
+        MAX_POSITION_SIZE=float(os.getenv('MAX_POSITION_SIZE', '0.01')),
+        STOP_LOSS=float(os.getenv('STOP_LOSS', '0.01')),
+        PROFIT_TARGET=float(os.getenv('PROFIT_TARGET', '0.02')),
+
+        EMA_SHORT=int(os.getenv('EMA_SHORT', '9')),
+        EMA_LONG=int(os.getenv('EMA_LONG', '21')),
+        RSI_PERIOD=int(os.getenv('RSI_PERIOD', '14')),
+        MACD_FAST=int(os.getenv('MACD_FAST', '12')),
+        MACD_SLOW=int(os.getenv('MACD_SLOW', '26')),
+        MACD_SIGNAL=int(os.getenv('MACD_SIGNAL', '9')),
+
+        MAX_DRAWDOWN=float(os.getenv('MAX_DRAWDOWN', '0.05')),
+        DAILY_LOSS_LIMIT=float(os.getenv('DAILY_LOSS_LIMIT', '0.02')),
+        MAX_ORDER_HISTORY=int(os.getenv('MAX_ORDER_HISTORY', '5000')),
+
+        NEW_LISTING_PROFIT_TARGET=float(os.getenv('NEW_LISTING_PROFIT_TARGET', '0.05')),
+        NEW_LISTING_STOP_LOSS=float(os.getenv('NEW_LISTING_STOP_LOSS', '0.03')),
+        VOLUME_SPIKE_THRESHOLD=float(os.getenv('VOLUME_SPIKE_THRESHOLD', '3.0')),
+        SCORE_THRESHOLD=float(os.getenv('SCORE_THRESHOLD', '80')),
+
+        LOG_LEVEL=os.getenv('LOG_LEVEL', 'INFO'),
+
+        DASHBOARD_HOST=os.getenv('DASHBOARD_HOST', '0.0.0.0'),
+        DASHBOARD_PORT=int(os.getenv('DASHBOARD_PORT', '5002')),
+
+        REDIS_URL=os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+        SOCKETIO_MESSAGE_QUEUE=os.getenv('SOCKETIO_MESSAGE_QUEUE', ''),
+
+        TELEGRAM_BOT_TOKEN=os.getenv('TELEGRAM_BOT_TOKEN', ''),
+        TELEGRAM_CHAT_ID=os.getenv('TELEGRAM_CHAT_ID', ''),
+    )
+
+
+# Indicator periods as a plain tuple for TA/NumPy code that should not touch Config
+STRATEGY_PARAMS = get_config().strategy_params
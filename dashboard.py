@@ -1,20 +1,128 @@
 # dashboard.py (updated for multi-bot)
-from flask import Flask, render_template, jsonify
-from flask_socketio import SocketIO
+import atexit
+from flask import Flask, render_template, request
+from flask_socketio import SocketIO, emit
+import hashlib
+import orjson
+import queue
 import threading
 import time
 import os
-from config import Config
+from config import get_config
 from multi_bot_manager import MultiBotManager
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
-socketio = SocketIO(app, cors_allowed_origins="*")
+config = get_config()
+# Plain OS threads rather than eventlet green threads: python-binance's websocket
+# managers and the bots' blocking REST calls each need a real thread (and asyncio loop)
+# With a message queue, several dashboard workers share one event stream and
+# bots in other processes can emit to the clients directly
+socketio = SocketIO(app, async_mode='threading', cors_allowed_origins="*",
+                    message_queue=config.SOCKETIO_MESSAGE_QUEUE or None)
 
 # Initialize multi-bot manager
-config = Config()
 bot_manager = MultiBotManager(config)
 bot_manager.initialize_bots()
+if config.SOCKETIO_MESSAGE_QUEUE:
+    bot_manager.forward_orders_to_socketio(config.SOCKETIO_MESSAGE_QUEUE)
+# close websockets / exchange sessions on interpreter exit (gunicorn worker or `python dashboard.py`)
+atexit.register(bot_manager.stop_all_bots)
+
+
+def _dumps(obj):
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+
+
+def ojsonify(obj):
+    """jsonify replacement backed by orjson (C encoder, emits bytes directly)"""
+    return app.response_class(_dumps(obj), mimetype='application/json')
+
+
+class _SnapshotCache:
+    """Tiny TTL cache so concurrent readers share one aggregation per window"""
+
+    def __init__(self, ttl=0.5):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> [timestamp, value, (payload, etag) or None]
+
+    def _entry(self, key, loader):
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is None or now - entry[0] >= self.ttl:
+            entry = [now, loader(), None]
+            self._entries[key] = entry
+        return entry
+
+    def get(self, key, loader):
+        with self._lock:
+            return self._entry(key, loader)[1]
+
+    def get_encoded(self, key, loader):
+        """(payload bytes, etag) for the current snapshot, encoded once per snapshot"""
+        with self._lock:
+            entry = self._entry(key, loader)
+            if entry[2] is None:
+                payload = _dumps(entry[1])
+                entry[2] = (payload, hashlib.blake2b(payload, digest_size=8).hexdigest())
+            return entry[2]
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_snapshot_cache = _SnapshotCache()
+
+# Bot events (order_placed / stats_changed) consumed by background_data_updater
+_events = queue.Queue()
+
+
+def _on_bot_event(event, payload):
+    _snapshot_cache.invalidate()
+    _events.put((event, payload))
+
+
+bot_manager.subscribe(_on_bot_event)
+
+# Config is immutable after startup, so /api/config is serialized exactly once
+_CONFIG_JSON = _dumps({
+    'symbol': config.SYMBOL,
+    'quantity': config.QUANTITY,
+    'profit_target': config.PROFIT_TARGET,
+    'stop_loss': config.STOP_LOSS,
+    'new_listing_profit_target': config.NEW_LISTING_PROFIT_TARGET,
+    'new_listing_stop_loss': config.NEW_LISTING_STOP_LOSS
+})
+
+STATS_DEBOUNCE = 0.25  # seconds; bursts of stat changes collapse into one emit
+
+
+def cached_stats():
+    return _snapshot_cache.get('stats', bot_manager.get_all_stats)
+
+
+def _load_orders():
+    return bot_manager.get_recent_orders(50)
+
+
+def cached_orders():
+    return _snapshot_cache.get('orders', _load_orders)
+
+
+def conditional_snapshot(key, loader):
+    """Serve a cached snapshot, answering 304 when the client already has it"""
+    payload, etag = _snapshot_cache.get_encoded(key, loader)
+    # weak comparison, as RFC 9110 prescribes for If-None-Match (also handles lists and *)
+    if request.if_none_match.contains_weak(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(payload, mimetype='application/json')
+    resp.set_etag(etag)
+    resp.cache_control.max_age = 1
+    return resp
+
 
 @app.route('/')
 def index():
@@ -22,50 +130,46 @@ def index():
 
 @app.route('/api/orders')
 def get_orders():
-    return jsonify(bot_manager.get_all_orders()[-50:])  # Last 50 orders
+    return conditional_snapshot('orders', _load_orders)  # Last 50 orders
 
 @app.route('/api/stats')
 def get_stats():
-    return jsonify(bot_manager.get_all_stats())
+    return conditional_snapshot('stats', bot_manager.get_all_stats)
 
 @app.route('/api/balance')
 def get_balance():
-    # Get balance from first bot (they all share the same account)
-    for bot_name, bot in bot_manager.bots.items():
-        if hasattr(bot, 'get_account_balance'):
-            return jsonify(bot.get_account_balance())
-    return jsonify({})
+    return ojsonify(get_balance_snapshot())
 
 @app.route('/api/start', methods=['POST'])
 def start_trading():
     bot_manager.start_all_bots()
-    return jsonify({'status': 'started', 'message': 'All trading bots started successfully'})
+    return ojsonify({'status': 'started', 'message': 'All trading bots started successfully'})
 
 @app.route('/api/stop', methods=['POST'])
 def stop_trading():
     bot_manager.stop_all_bots()
-    return jsonify({'status': 'stopped', 'message': 'All trading bots stopped'})
+    return ojsonify({'status': 'stopped', 'message': 'All trading bots stopped'})
 
 @app.route('/api/start-bot/<bot_name>', methods=['POST'])
 def start_single_bot(bot_name):
     if bot_name in bot_manager.bots:
         bot_manager.bots[bot_name].start()
-        return jsonify({'status': 'started', 'message': f'{bot_name} started successfully'})
-    return jsonify({'status': 'error', 'message': 'Bot not found'})
+        return ojsonify({'status': 'started', 'message': f'{bot_name} started successfully'})
+    return ojsonify({'status': 'error', 'message': 'Bot not found'})
 
 @app.route('/api/stop-bot/<bot_name>', methods=['POST'])
 def stop_single_bot(bot_name):
     if bot_name in bot_manager.bots:
         bot_manager.bots[bot_name].stop()
-        return jsonify({'status': 'stopped', 'message': f'{bot_name} stopped successfully'})
-    return jsonify({'status': 'error', 'message': 'Bot not found'})
+        return ojsonify({'status': 'stopped', 'message': f'{bot_name} stopped successfully'})
+    return ojsonify({'status': 'error', 'message': 'Bot not found'})
 
 @app.route('/api/health')
 def health_check():
-    stats = bot_manager.get_all_stats()
+    stats = cached_stats()
     running_bots = sum(1 for bot_stats in stats.values() if bot_stats.get('running', False))
     
-    return jsonify({
+    return ojsonify({
         'status': 'healthy',
         'total_bots': len(bot_manager.bots),
         'running_bots': running_bots,
@@ -73,45 +177,60 @@ def health_check():
     })
 
 @app.route('/api/config')
-def get_config():
-    return jsonify({
-        'symbol': config.SYMBOL,
-        'quantity': config.QUANTITY,
-        'profit_target': config.PROFIT_TARGET,
-        'stop_loss': config.STOP_LOSS,
-        'new_listing_profit_target': config.NEW_LISTING_PROFIT_TARGET,
-        'new_listing_stop_loss': config.NEW_LISTING_STOP_LOSS
-    })
+def get_config_json():
+    return app.response_class(_CONFIG_JSON, mimetype='application/json',
+                              headers={'Cache-Control': 'public, max-age=3600'})
 
 @socketio.on('connect')
 def handle_connect():
     print('Client connected to dashboard')
-    socketio.emit('status_update', {
+    # Full snapshot only for the newly connected client; afterwards it gets deltas
+    emit('status_update', {
         'status': 'connected', 
         'total_bots': len(bot_manager.bots)
     })
+    emit('orders_snapshot', cached_orders()[:20])
+    emit('stats_update', cached_stats())
+    emit('balance_update', get_balance_snapshot())
 
 @socketio.on('disconnect')
 def handle_disconnect():
     print('Client disconnected from dashboard')
 
+def get_balance_snapshot():
+    balance_bot = bot_manager.balance_bot
+    return balance_bot.get_account_balance() if balance_bot else {}
+
 def background_data_updater():
-    """Background thread to update data periodically"""
+    """Emit bot events to dashboard clients as they happen"""
+    stats_due = None
     while True:
+        timeout = 3 if stats_due is None else min(3, max(0, stats_due - time.monotonic()))
+        bot_manager.state_changed.wait(timeout=timeout)
+        bot_manager.state_changed.clear()
+
         try:
-            socketio.emit('orders_update', bot_manager.get_all_orders()[-20:])
-            socketio.emit('stats_update', bot_manager.get_all_stats())
-            
-            # Get balance from any bot
-            for bot_name, bot in bot_manager.bots.items():
-                if hasattr(bot, 'get_account_balance'):
-                    socketio.emit('balance_update', bot.get_account_balance())
+            while True:
+                try:
+                    event, payload = _events.get_nowait()
+                except queue.Empty:
                     break
+                if event == 'order_placed' and not config.SOCKETIO_MESSAGE_QUEUE:
+                    socketio.emit('orders_update', [payload])
+                if stats_due is None:
+                    stats_due = time.monotonic() + STATS_DEBOUNCE
+
+            if stats_due is not None and time.monotonic() >= stats_due:
+                stats_due = None
+                socketio.emit('stats_update', cached_stats())
+                socketio.emit('balance_update', get_balance_snapshot())
                     
         except Exception as e:
             print(f"Error in background updater: {e}")
-        
-        time.sleep(3)
+
+# Started at import so it runs both under `python dashboard.py` and
+# `gunicorn -w 1 --threads 100 dashboard:app`
+socketio.start_background_task(background_data_updater)
 
 if __name__ == '__main__':
     host = config.DASHBOARD_HOST
@@ -121,9 +240,4 @@ if __name__ == '__main__':
     print(f"Available Bots: {list(bot_manager.bots.keys())}")
     print(f"Main Trading Symbol: {config.SYMBOL}")
     
-    # Start background updater
-    updater_thread = threading.Thread(target=background_data_updater)
-    updater_thread.daemon = True
-    updater_thread.start()
-    
     socketio.run(app, host=host, port=port, debug=False, allow_unsafe_werkzeug=True)
\ No newline at end of file
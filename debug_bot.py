@@ -1,41 +1,52 @@
 # debug_bot.py
-from binance.client import Client
-from config import Config
+from binance import AsyncClient
+from config import get_config
+from binance_client import get_client
+from trading_utils import place_test_limit_buy
+import asyncio
 import logging
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('DebugBot')
 
+def _log_server_time(server_time):
+    logger.info(f"✅ Binance server time: {server_time['serverTime']}")
+
+def _log_account(account):
+    logger.info("💰 Account balances:")
+    for balance in account['balances']:
+        if float(balance['free']) > 0 or float(balance['locked']) > 0:
+            logger.info(f"  {balance['asset']}: Free={balance['free']}, Locked={balance['locked']}")
+
+async def fetch_snapshot(config, symbol):
+    """Fetch server time, account, ticker, order book and klines concurrently on one aiohttp session"""
+    client = await AsyncClient.create(config.BINANCE_API_KEY, config.BINANCE_API_SECRET, testnet=True)
+    try:
+        return await asyncio.gather(
+            client.get_server_time(),
+            client.get_account(),
+            client.get_symbol_ticker(symbol=symbol),
+            client.get_order_book(symbol=symbol),
+            client.get_historical_klines(symbol, AsyncClient.KLINE_INTERVAL_1HOUR, "1 day ago UTC"),
+        )
+    finally:
+        await client.close_connection()
+
 def debug_binance_connection():
     """Debug Binance API connection"""
     try:
-        config = Config()
-        client = Client(config.BINANCE_API_KEY, config.BINANCE_API_SECRET, testnet=True)
+        config = get_config()
+        symbol = config.SYMBOL
         
-        # Test connection
+        # The probes are independent: wall time ~ slowest RTT instead of the sum
         logger.info("🔌 Testing Binance connection...")
-        server_time = client.get_server_time()
-        logger.info(f"✅ Binance server time: {server_time['serverTime']}")
+        server_time, account, ticker, depth, klines = asyncio.run(fetch_snapshot(config, symbol))
         
-        # Test account info
-        account = client.get_account()
-        logger.info("💰 Account balances:")
-        for balance in account['balances']:
-            if float(balance['free']) > 0 or float(balance['locked']) > 0:
-                logger.info(f"  {balance['asset']}: Free={balance['free']}, Locked={balance['locked']}")
-        
-        # Test symbol price
-        symbol = config.SYMBOL
-        ticker = client.get_symbol_ticker(symbol=symbol)
+        _log_server_time(server_time)
+        _log_account(account)
         logger.info(f"📈 {symbol} current price: {ticker['price']}")
-        
-        # Test order book
-        depth = client.get_order_book(symbol=symbol)
         logger.info(f"📊 Order book - Bids: {len(depth['bids'])}, Asks: {len(depth['asks'])}")
-        
-        # Test historical data
-        klines = client.get_historical_klines(symbol, Client.KLINE_INTERVAL_1HOUR, "1 day ago UTC")
         logger.info(f"📅 Historical klines: {len(klines)} candles")
         
         return True
@@ -46,24 +57,21 @@ def debug_binance_connection():
 
 def test_order_placement():
     """Test placing a small order"""
+    config = get_config()
+    if config.DRY_RUN:
+        # No Binance round-trips and no testnet side effects in dry-run mode
+        logger.info(f"🧪 DRY_RUN enabled - skipping test order for {config.SYMBOL}")
+        return True
+    
     try:
-        config = Config()
-        client = Client(config.BINANCE_API_KEY, config.BINANCE_API_SECRET, testnet=True)
+        client = get_client()
         
         symbol = config.SYMBOL
-        current_price = float(client.get_symbol_ticker(symbol=symbol)['price'])
         
         logger.info(f"🔄 Testing order placement for {symbol}...")
         
-        # Try to place a very small limit order (likely won't fill, but tests API)
-        test_price = current_price * 0.5  # Very low price to avoid actual execution
-        quantity = 0.001
-        
-        order = client.order_limit_buy(
-            symbol=symbol,
-            quantity=quantity,
-            price=str(round(test_price, 2))
-        )
+        # Very small limit order at half the market price: tests the API without filling
+        order = place_test_limit_buy(symbol, 0.5)
         
         logger.info(f"✅ TEST ORDER PLACED: {order}")
         
@@ -2,48 +2,244 @@
 import logging
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List
+import asyncio
+import heapq
+import itertools
+import random
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 from binance.client import Client
-from binance import ThreadedWebsocketManager
-import pandas as pd
+from binance import AsyncClient, ThreadedWebsocketManager
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from binance_client import get_client
 import numpy as np
 import requests
-import json
 from decimal import Decimal
+from cachetools import TTLCache
+
+def ts_to_dt(ns):
+    """Local datetime for an order's timestamp_ns, for display only"""
+    return datetime.fromtimestamp(ns / 1e9)
+
+
+def _scaled_int(value):
+    """'0.00100000' -> (1, 1000): a filter size as an integer count of 1/scale units"""
+    d = Decimal(value).normalize()
+    decimals = max(-d.as_tuple().exponent, 0)
+    scale = 10 ** decimals
+    return int(d * scale), scale
+
+
+@dataclass(slots=True)
+class SymInfo:
+    """Exchange filters for one symbol, parsed once per refresh"""
+    step: float
+    step_int: int
+    step_scale: int
+    min_notional: float
+
+
+# miniticker cache entries older than this fall back to one batched REST call
+PRICE_STALE_AFTER = 30  # seconds
+# smallest buy the bots will place, whatever the symbol's own notional filter says
+MIN_ORDER_USDT = Decimal('10')
+# API error codes worth retrying: -1000 unknown/internal, -1001 disconnected, -1003 rate limit
+RETRYABLE_CODES = frozenset({-1000, -1001, -1003})
 
 class BaseBot:
+    # seconds between poll() calls; None => the bot is event-driven and never polled
+    poll_interval = None
+
     def __init__(self, name, config, client):
         self.name = name
         self.config = config
         self.client = client
-        self.orders = []
+        self.orders = deque(maxlen=config.MAX_ORDER_HISTORY)  # bounded history, newest on the right
+        # lifetime stats, updated in _record so get_stats never rescans orders
+        self._filled_count = 0
+        self._win_count = 0
+        self._total_profit = 0.0
+        # _record runs on pool workers and websocket threads; guards orders and the totals above
+        self._stats_lock = threading.Lock()
         self.positions = []
         self.running = False
         self.logger = logging.getLogger(name)
+        # set by MultiBotManager so order/stat changes reach subscribers
+        self.manager = None
+        # shared worker pool, also set by MultiBotManager
+        self.executor = None
         # symbol info cache
         self._symbol_info_cache = {}
         self._symbol_info_cache_ts = {}
+        # free USDT balance cache, invalidated whenever an order goes through
+        self._usdt_balance = 0.0
+        self._usdt_ts = 0
 
     def start(self):
         self.running = True
-        self.logger.info(f"{self.name} started")
+        self.logger.info("%s started", self.name)
+        self.notify('stats_changed')
+        if self.poll_interval is not None:
+            self.schedule()
 
     def stop(self):
         self.running = False
-        self.logger.info(f"{self.name} stopped")
+        if self.manager is not None:
+            self.manager.unschedule(self)
+        self.logger.info("%s stopped", self.name)
+        self.notify('stats_changed')
+
+    def poll(self):
+        """One unit of periodic work; bots with a poll_interval override this (plain or async def)"""
+
+    async def aclose(self):
+        """Release async resources bound to the polling loop; runs on that loop once polling ends"""
+
+    def schedule(self):
+        """Run poll() every poll_interval seconds while running, on the manager's event loop if managed"""
+        if self.manager is not None:
+            self.manager.schedule(self)
+            return
+
+        def loop():
+            event_loop = asyncio.new_event_loop()
+            try:
+                while self.running:
+                    result = self.poll()
+                    if asyncio.iscoroutine(result):
+                        event_loop.run_until_complete(result)
+                    time.sleep(self.poll_interval)
+            finally:
+                event_loop.run_until_complete(self.aclose())
+                event_loop.close()
+
+        threading.Thread(target=loop, daemon=True).start()
+
+    def notify(self, event, payload=None):
+        """Publish an event to the manager's subscribers (no-op when unmanaged)"""
+        if self.manager is not None:
+            self.manager.publish(event, payload)
+
+    def submit(self, fn, *args):
+        """Run fn(*args) on the shared pool (or a one-off daemon thread when unmanaged)"""
+        if self.executor is not None:
+            return self.executor.submit(fn, *args)
+        threading.Thread(target=fn, args=args, daemon=True).start()
+
+    def _record(self, order_info):
+        """Stamp and store a new order, update the running stats and let subscribers know about it"""
+        order_info['timestamp_ns'] = time.time_ns()
+        with self._stats_lock:
+            self.orders.append(order_info)
+            if order_info.get('status') == 'FILLED':
+                profit = order_info.get('profit', 0)
+                self._filled_count += 1
+                self._win_count += profit > 0
+                self._total_profit += profit
+        self.notify('order_placed', order_info)
+
+    def _execute_buy(self, symbol, price, qty, reason, tp_mult, sl_mult):
+        """Market-buy qty, record the order and open a position; returns the fill price or None"""
+        order = self.safe_order(self.client.order_market_buy, symbol=symbol, quantity=str(qty))
+        if not order:
+            self.logger.error("Buy order failed for %s", symbol)
+            return None
+
+        fills = order.get('fills')
+        buy_price = float(fills[0]['price']) if fills else price
+
+        self._record({
+            'order_id': order.get('orderId'),
+            'symbol': symbol,
+            'side': 'BUY',
+            'type': 'MARKET',
+            'quantity': qty,
+            'price': buy_price,
+            'status': order.get('status'),
+            'reason': reason,
+            'bot': self.name
+        })
+
+        self.positions.append({
+            'symbol': symbol,
+            'entry_price': buy_price,
+            'quantity': qty,
+            'entry_time_ns': time.time_ns(),
+            'take_profit': buy_price * tp_mult,
+            'stop_loss': buy_price * sl_mult
+        })
+        return buy_price
+
+    def _execute_sell(self, position, reason):
+        """Market-sell a position, record the order and close it; returns (price, profit) or None"""
+        order = self.safe_order(self.client.order_market_sell,
+                                symbol=position['symbol'],
+                                quantity=str(position['quantity']))
+        if not order:
+            self.logger.error("Sell order failed for %s", position.get('symbol'))
+            return None
+
+        fills = order.get('fills')
+        sell_price = float(fills[0]['price']) if fills else 0
+        profit = (sell_price - position['entry_price']) * position['quantity']
+
+        self._record({
+            'order_id': order.get('orderId'),
+            'symbol': position['symbol'],
+            'side': 'SELL',
+            'type': 'MARKET',
+            'quantity': position['quantity'],
+            'price': sell_price,
+            'status': order.get('status'),
+            'reason': reason,
+            'profit': profit,
+            'bot': self.name
+        })
+        self.positions.remove(position)
+        return sell_price, profit
+
+    def get_prices(self, symbols):
+        """Current price for each symbol, served from the manager's websocket cache when available"""
+        if self.manager is not None:
+            return self.manager.get_prices(symbols)
+        return {t['symbol']: float(t['price']) for t in self.client.get_all_tickers() if t['symbol'] in symbols}
+
+    def get_usdt(self, ttl=5):
+        """Free USDT balance, refetched via get_account() at most once per ttl seconds"""
+        if time.time() - self._usdt_ts < ttl:
+            return self._usdt_balance
+        account = self.client.get_account()
+        self._usdt_balance = next((float(asset['free']) for asset in account.get('balances', [])
+                                   if asset['asset'] == 'USDT'), 0)
+        self._usdt_ts = time.time()
+        return self._usdt_balance
 
     def safe_order(self, fn, *args, retries=3, backoff=1, **kwargs):
-        """Retry wrapper for Binance order calls"""
+        """Retry wrapper for Binance order calls; only transient failures are retried"""
         for i in range(retries):
             try:
-                return fn(*args, **kwargs)
+                order = fn(*args, **kwargs)
+                self._usdt_ts = 0  # a BUY/SELL went through, balance changed
+                return order
+            except BinanceAPIException as e:
+                if e.code not in RETRYABLE_CODES and e.status_code < 500:
+                    # insufficient balance, filter failure, ...: retrying cannot help
+                    self.logger.error("Order rejected: %s", e)
+                    return None
+                self.logger.error("Order call error attempt %s/%s: %s", i+1, retries, e)
+            except (BinanceRequestException, requests.exceptions.RequestException) as e:
+                self.logger.error("Order call error attempt %s/%s: %s", i+1, retries, e)
             except Exception as e:
-                self.logger.error(f"Order call error attempt {i+1}/{retries}: {e}")
-                time.sleep(backoff * (i+1))
+                self.logger.error("Order call failed: %s", e)
+                return None
+            if i + 1 < retries:
+                # jitter keeps bots that failed together from retrying together
+                time.sleep(min(backoff * 2 ** i + random.random(), 30))
         return None
 
-    def get_symbol_info(self, symbol, force_refresh=False):
+    def get_symbol_info(self, symbol, force_refresh=False) -> SymInfo:
         now = time.time()
         cache = self._symbol_info_cache.get(symbol)
         ts = self._symbol_info_cache_ts.get(symbol, 0)
@@ -54,34 +250,40 @@ class BaseBot:
             if not info:
                 return None
             filters = {f['filterType']: f for f in info.get('filters', [])}
-            step_size = Decimal(filters['LOT_SIZE']['stepSize'])
-            tick_size = Decimal(filters['PRICE_FILTER']['tickSize'])
-            min_notional = Decimal(filters.get('MIN_NOTIONAL', {}).get('minNotional', '0'))
-            res = {'stepSize': step_size, 'tickSize': tick_size, 'minNotional': min_notional}
+            step_size = filters['LOT_SIZE']['stepSize']
+            # spot symbols migrated from MIN_NOTIONAL to the NOTIONAL filter
+            notional = filters.get('MIN_NOTIONAL') or filters.get('NOTIONAL') or {}
+            min_notional = notional.get('minNotional', '0')
+            step_int, step_scale = _scaled_int(step_size)
+            res = SymInfo(step=float(step_size), step_int=step_int, step_scale=step_scale,
+                          min_notional=float(min_notional))
             self._symbol_info_cache[symbol] = res
             self._symbol_info_cache_ts[symbol] = now
             return res
         except Exception as e:
-            self.logger.error(f"Error fetching symbol info for {symbol}: {e}")
+            self.logger.error("Error fetching symbol info for %s: %s", symbol, e)
             return None
 
-    def quantize_qty(self, qty: Decimal, step: Decimal):
-        if step == 0:
-            return float(qty)
-        q = (qty // step) * step
-        return float(q)
-
-    def quantize_price(self, price: Decimal, tick: Decimal):
-        if tick == 0:
-            return float(price)
-        p = (price // tick) * tick
-        return float(p)
+    def _should_place_order(self, qty, price, info: SymInfo) -> bool:
+        """Filter pre-check so a buy that the exchange would reject never reaches safe_order"""
+        if qty <= 0 or qty < info.step:
+            return False
+        notional = Decimal(str(qty)) * Decimal(str(price))
+        return notional > MIN_ORDER_USDT and notional >= Decimal(str(info.min_notional))
+
+    def quantize_qty_int(self, qty: float, step_int: int, step_scale: int):
+        """Round qty down to the step using integer math (no str/Decimal round-trip)"""
+        if step_int == 0:
+            return qty
+        # round() absorbs float noise such as 0.29 * 100 == 28.999999999999996
+        units = int(round(qty * step_scale, 6))
+        return (units // step_int) * step_int / step_scale
 
     def get_stats(self):
-        filled_orders = [o for o in self.orders if o.get('status') == 'FILLED']
-        total_trades = len(filled_orders)
-        winning_trades = len([o for o in filled_orders if o.get('profit', 0) > 0])
-        total_profit = sum([o.get('profit', 0) for o in filled_orders])
+        with self._stats_lock:
+            total_trades = self._filled_count
+            winning_trades = self._win_count
+            total_profit = self._total_profit
 
         return {
             'name': self.name,
@@ -95,100 +297,84 @@ class BaseBot:
 
 
 class NewListingBot(BaseBot):
+    poll_interval = 60
+
     def __init__(self, config, client):
         super().__init__("NewListingBot", config, client)
-        self.monitored_symbols = set()
-        self.new_listings_cache = {}
+        self.monitored_symbols = frozenset()
+        # symbols we already bought; expire after a day so the cache can't grow without bound
+        self.new_listings_cache = TTLCache(maxsize=10000, ttl=86400)
+        self._cache_lock = threading.Lock()
 
-    def start(self):
-        super().start()
-        self._thread = threading.Thread(target=self.monitor_new_listings, daemon=True)
-        self._thread.start()
+    def poll(self):
+        self.monitor_new_listings()
 
     def monitor_new_listings(self):
-        while self.running:
-            try:
-                exchange_info = self.client.get_exchange_info()
-                current_symbols = {symbol['symbol'] for symbol in exchange_info.get('symbols', [])}
+        try:
+            exchange_info = self.client.get_exchange_info()
+            current_symbols = frozenset(symbol['symbol'] for symbol in exchange_info.get('symbols', []))
 
+            # most cycles list nothing new: skip the diff and the loop entirely
+            if current_symbols != self.monitored_symbols:
                 new_symbols = current_symbols - self.monitored_symbols
 
                 for symbol in new_symbols:
-                    if symbol.endswith('USDT') and symbol not in self.new_listings_cache:
-                        self.logger.info(f"New symbol detected: {symbol}")
-                        # analyze in separate thread to avoid blocking
-                        threading.Thread(target=self.analyze_new_listing, args=(symbol,), daemon=True).start()
+                    with self._cache_lock:
+                        seen = symbol in self.new_listings_cache
+                    if symbol.endswith('USDT') and not seen:
+                        self.logger.info("New symbol detected: %s", symbol)
+                        # analyze on the worker pool to avoid blocking
+                        self.submit(self.analyze_new_listing, symbol)
 
                 self.monitored_symbols = current_symbols
 
-            except Exception as e:
-                self.logger.error(f"Error monitoring new listings: {e}")
-
-            time.sleep(60)
+        except Exception as e:
+            self.logger.error("Error monitoring new listings: %s", e)
 
     def analyze_new_listing(self, symbol):
         try:
             ticker = self.client.get_symbol_ticker(symbol=symbol)
             initial_price = float(ticker['price'])
 
-            self.logger.info(f"New listing {symbol} at price: {initial_price}")
+            self.logger.info("New listing %s at price: %s", symbol, initial_price)
 
-            account = self.client.get_account()
-            usdt_balance = next((float(asset['free']) for asset in account.get('balances', [])
-                                 if asset['asset'] == 'USDT'), 0)
+            usdt_balance = self.get_usdt()
 
             if usdt_balance > 10:
                 # use max 2% of balance for new listing
-                raw_qty = Decimal(str(usdt_balance)) * Decimal('0.02') / Decimal(str(initial_price))
+                raw_qty = usdt_balance * 0.02 / initial_price
                 symbol_info = self.get_symbol_info(symbol)
                 if symbol_info is None:
-                    self.logger.warning(f"No symbol info for {symbol}, skipping trade")
+                    self.logger.warning("No symbol info for %s, skipping trade", symbol)
                     return
-                step = symbol_info['stepSize']
-                qty = float((raw_qty // step) * step)
-                if (Decimal(str(qty)) * Decimal(str(initial_price))) > Decimal('10'):
-                    order = self.safe_order(self.client.order_market_buy, symbol=symbol, quantity=str(qty))
-                    if not order:
-                        self.logger.error(f"Buy order failed for {symbol}")
+                qty = self.quantize_qty_int(raw_qty, symbol_info.step_int, symbol_info.step_scale)
+                if self._should_place_order(qty, initial_price, symbol_info):
+                    buy_price = self._execute_buy(symbol, initial_price, qty, 'New listing purchase',
+                                                  1 + self.config.NEW_LISTING_PROFIT_TARGET,
+                                                  1 - self.config.NEW_LISTING_STOP_LOSS)
+                    if buy_price is None:
                         return
 
-                    buy_price = float(order.get('fills', [])[0].get('price')) if order.get('fills') else initial_price
-
-                    order_info = {
-                        'order_id': order.get('orderId'),
-                        'symbol': symbol,
-                        'side': 'BUY',
-                        'type': 'MARKET',
-                        'quantity': qty,
-                        'price': buy_price,
-                        'status': order.get('status'),
-                        'timestamp': datetime.now(),
-                        'reason': 'New listing purchase',
-                        'bot': self.name
-                    }
-
-                    self.orders.append(order_info)
-
-                    self.positions.append({
-                        'symbol': symbol,
-                        'entry_price': buy_price,
-                        'quantity': qty,
-                        'entry_time': datetime.now(),
-                        'take_profit': buy_price * (1 + self.config.NEW_LISTING_PROFIT_TARGET),
-                        'stop_loss': buy_price * (1 - self.config.NEW_LISTING_STOP_LOSS)
-                    })
-
-                    self.new_listings_cache[symbol] = {'entry_price': buy_price, 'entry_time': datetime.now()}
+                    with self._cache_lock:
+                        self.new_listings_cache[symbol] = {'entry_price': buy_price, 'entry_time_ns': time.time_ns()}
 
-                    self.logger.info(f"New listing purchase: {symbol} at {buy_price}")
+                    self.logger.info("New listing purchase: %s at %s", symbol, buy_price)
 
         except Exception as e:
-            self.logger.error(f"Error analyzing new listing {symbol}: {e}")
+            self.logger.error("Error analyzing new listing %s: %s", symbol, e)
 
     def check_new_listing_positions(self):
+        try:
+            prices = self.get_prices({p['symbol'] for p in self.positions})
+        except Exception as e:
+            self.logger.error("Error fetching prices for positions: %s", e)
+            return
+
         for position in self.positions[:]:
             try:
-                current_price = float(self.client.get_symbol_ticker(symbol=position['symbol'])['price'])
+                current_price = prices.get(position['symbol'])
+                if current_price is None:
+                    continue
 
                 if current_price >= position['take_profit']:
                     self.place_sell_order(position, "New listing take profit")
@@ -196,116 +382,162 @@ class NewListingBot(BaseBot):
                     self.place_sell_order(position, "New listing stop loss")
 
             except Exception as e:
-                self.logger.error(f"Error checking position {position.get('symbol')}: {e}")
+                self.logger.error("Error checking position %s: %s", position.get('symbol'), e)
 
     def place_sell_order(self, position, reason):
         try:
-            order = self.safe_order(self.client.order_market_sell,
-                                    symbol=position['symbol'],
-                                    quantity=str(position['quantity']))
-            if not order:
-                self.logger.error(f"Sell order failed for {position.get('symbol')}")
+            result = self._execute_sell(position, reason)
+            if result is None:
                 return
+            sell_price, profit = result
 
-            sell_price = float(order.get('fills', [])[0].get('price')) if order.get('fills') else 0
-            profit = (sell_price - position['entry_price']) * position['quantity']
-
-            order_info = {
-                'order_id': order.get('orderId'),
-                'symbol': position['symbol'],
-                'side': 'SELL',
-                'type': 'MARKET',
-                'quantity': position['quantity'],
-                'price': sell_price,
-                'status': order.get('status'),
-                'timestamp': datetime.now(),
-                'reason': reason,
-                'profit': profit,
-                'bot': self.name
-            }
-
-            self.orders.append(order_info)
-            self.positions.remove(position)
-
-            self.logger.info(f"New listing sale: {position['symbol']} at {sell_price}, Profit: {profit:.4f}")
+            self.logger.info("New listing sale: %s at %s, Profit: %.4f", position['symbol'], sell_price, profit)
 
         except Exception as e:
-            self.logger.error(f"Error selling new listing position: {e}")
+            self.logger.error("Error selling new listing position: %s", e)
 
 
 class HighVolumeBot(BaseBot):
+    poll_interval = 300
+    KLINES_CONCURRENCY = 20
+    KLINE_BUF_LEN = 200  # covers the 1-week hourly (168) and 1-day 15m (96) windows
+
     def __init__(self, config, client):
         super().__init__("HighVolumeBot", config, client)
+        # symbols with an open position; entries leave only when the position is sold,
+        # so unlike new_listings_cache this must never expire
         self.trading_symbols = set()
+        self._cache_lock = threading.Lock()
         self.volume_data = {}
+        # 24h volume per symbol as of the last cycle that scored it
+        self._prev_volume = {}
+        # aiohttp-based client for the klines fan-out; orders stay on the shared sync client
+        self.aclient = None
+        # kline columns are parsed into these instead of a fresh array per symbol;
+        # scoring runs on the scheduler thread only, trade checks get per-worker buffers
+        self._vol_buf = np.empty(self.KLINE_BUF_LEN)
+        self._bufs = threading.local()
+
+    def _fill(self, buf, klines, col):
+        """Write one kline column into buf in place and return a view of the filled part"""
+        klines = klines[-len(buf):]
+        n = len(klines)
+        buf[:n] = [k[col] for k in klines]
+        return buf[:n]
+
+    def _worker_bufs(self):
+        """(closes, volumes) scratch buffers owned by the calling pool thread"""
+        bufs = self._bufs
+        if not hasattr(bufs, 'close'):
+            bufs.close = np.empty(self.KLINE_BUF_LEN)
+            bufs.vol = np.empty(self.KLINE_BUF_LEN)
+        return bufs.close, bufs.vol
+
+    async def poll(self):
+        await self.analyze_high_volume_coins()
+
+    async def aclose(self):
+        # the aiohttp session belongs to the polling loop, so it is closed there
+        aclient, self.aclient = self.aclient, None
+        if aclient is not None:
+            await aclient.close_connection()
+
+    async def _get_aclient(self):
+        # created lazily so it binds to the loop that polls this bot
+        if self.aclient is None:
+            self.aclient = await AsyncClient.create(self.config.BINANCE_API_KEY, self.config.BINANCE_API_SECRET,
+                                                    testnet=True)
+        return self.aclient
+
+    async def _fetch_klines_all(self, symbols):
+        """Hourly klines for every symbol, up to KLINES_CONCURRENCY requests in flight"""
+        aclient = await self._get_aclient()
+        sem = asyncio.Semaphore(self.KLINES_CONCURRENCY)
+
+        async def fetch(symbol):
+            async with sem:
+                return await aclient.get_historical_klines(symbol, AsyncClient.KLINE_INTERVAL_1HOUR,
+                                                           "1 week ago UTC")
+
+        return await asyncio.gather(*(fetch(symbol) for symbol in symbols), return_exceptions=True)
+
+    async def analyze_high_volume_coins(self):
+        try:
+            aclient = await self._get_aclient()
+            tickers_24hr = await aclient.get_ticker()
+
+            prev = self._prev_volume
+            listed = set()
+            candidates = []
+            for ticker in tickers_24hr:
+                if ticker['symbol'].endswith('USDT'):
+                    symbol = ticker['symbol']
+                    volume = float(ticker.get('volume', 0))
+                    price_change = float(ticker.get('priceChangePercent', 0))
+                    listed.add(symbol)
+
+                    # only symbols whose volume moved >= 5% since last scored are worth a klines call
+                    prev_volume = prev.get(symbol)
+                    if prev_volume is not None and abs(volume - prev_volume) / max(prev_volume, 1) < 0.05:
+                        continue
+
+                    candidates.append((symbol, volume, price_change))
+
+            for symbol in prev.keys() - listed:
+                del prev[symbol]
+
+            all_klines = await self._fetch_klines_all([c[0] for c in candidates])
+
+            volume_scores = []
+            for (symbol, volume, price_change), klines in zip(candidates, all_klines):
+                if isinstance(klines, Exception):
+                    self.logger.error("Error fetching klines for %s: %s", symbol, klines)
+                    continue
+
+                score = self.calculate_volume_score(symbol, klines, volume, price_change)
+                if score is None:
+                    continue
+                # a symbol's baseline only advances once it has actually been scored,
+                # so a failed fetch is retried next cycle instead of being filtered out
+                prev[symbol] = volume
+
+                if score > self.config.SCORE_THRESHOLD:
+                    volume_scores.append({
+                        'symbol': symbol,
+                        'score': score,
+                        'volume': volume,
+                        'price_change': price_change
+                    })
 
-    def start(self):
-        super().start()
-        self._thread = threading.Thread(target=self.analyze_high_volume_coins, daemon=True)
-        self._thread.start()
-
-    def analyze_high_volume_coins(self):
-        while self.running:
-            try:
-                tickers_24hr = self.client.get_ticker()
-
-                volume_scores = []
-                for ticker in tickers_24hr:
-                    if ticker['symbol'].endswith('USDT'):
-                        symbol = ticker['symbol']
-                        volume = float(ticker.get('volume', 0))
-                        price_change = float(ticker.get('priceChangePercent', 0))
-
-                        score = self.calculate_volume_score(symbol, volume, price_change)
-
-                        if score > self.config.SCORE_THRESHOLD:
-                            volume_scores.append({
-                                'symbol': symbol,
-                                'score': score,
-                                'volume': volume,
-                                'price_change': price_change
-                            })
-
-                volume_scores.sort(key=lambda x: x['score'], reverse=True)
-                top_coins = volume_scores[:5]
-
-                for coin in top_coins:
-                    if coin['symbol'] not in self.trading_symbols:
-                        threading.Thread(target=self.analyze_coin_for_trade, args=(coin,), daemon=True).start()
+            volume_scores.sort(key=lambda x: x['score'], reverse=True)
+            top_coins = volume_scores[:5]
 
-                self.check_high_volume_positions()
+            for coin in top_coins:
+                with self._cache_lock:
+                    trading = coin['symbol'] in self.trading_symbols
+                if not trading:
+                    self.submit(self.analyze_coin_for_trade, coin)
 
-            except Exception as e:
-                self.logger.error(f"Error in high volume analysis: {e}")
+            await asyncio.get_running_loop().run_in_executor(self.executor, self.check_high_volume_positions)
 
-            time.sleep(300)
+        except Exception as e:
+            self.logger.error("Error in high volume analysis: %s", e)
 
-    def calculate_volume_score(self, symbol, volume, price_change):
+    def calculate_volume_score(self, symbol, klines, volume, price_change):
         try:
-            klines = self.client.get_historical_klines(symbol, Client.KLINE_INTERVAL_1HOUR, "1 week ago UTC")
-
             if len(klines) < 24:
                 return 0
 
-            volumes = [float(k[5]) for k in klines]
-            avg_volume = np.mean(volumes[-168:]) if len(volumes) >= 168 else np.mean(volumes)
-
-            if avg_volume == 0:
-                return 0
-
-            volume_ratio = volume / avg_volume
-
-            volume_score = min(volume_ratio * 20, 50)
-            momentum_score = abs(price_change) * 2
-            consistency_score = min(np.std(volumes[-24:]) / avg_volume * 100, 30) if len(volumes) >= 24 else 15
-
-            total_score = volume_score + momentum_score + (30 - consistency_score)
+            # parse the volume column into the reused buffer, scored by the (JIT) kernel
+            volumes = self._fill(self._vol_buf, klines, 5)
+            from volume_kernels import volume_score  # lazy: compile/cache load on first use only
+            total_score = volume_score(volumes, volume, price_change)
 
             return total_score
 
         except Exception as e:
-            self.logger.error(f"Error calculating score for {symbol}: {e}")
-            return 0
+            self.logger.error("Error calculating score for %s: %s", symbol, e)
+            return None
 
     def analyze_coin_for_trade(self, coin):
         try:
@@ -316,76 +548,56 @@ class HighVolumeBot(BaseBot):
             if len(klines) < 20:
                 return
 
-            closes = [float(k[4]) for k in klines]
-            volumes = [float(k[5]) for k in klines]
-
-            current_price = closes[-1]
-            sma_20 = np.mean(closes[-20:])
-            volume_sma = np.mean(volumes[-20:])
+            close_buf, vol_buf = self._worker_bufs()
+            closes = self._fill(close_buf, klines, 4)
+            volumes = self._fill(vol_buf, klines, 5)
 
-            if (current_price > sma_20 * 1.02 and volumes[-1] > volume_sma * self.config.VOLUME_SPIKE_THRESHOLD):
-                self.place_high_volume_buy(symbol, current_price, coin['score'])
+            from volume_kernels import is_volume_breakout
+            if is_volume_breakout(closes, volumes, self.config.VOLUME_SPIKE_THRESHOLD):
+                self.place_high_volume_buy(symbol, float(closes[-1]), coin['score'])
 
         except Exception as e:
-            self.logger.error(f"Error analyzing coin {coin.get('symbol')}: {e}")
+            self.logger.error("Error analyzing coin %s: %s", coin.get('symbol'), e)
 
     def place_high_volume_buy(self, symbol, price, score):
         try:
-            account = self.client.get_account()
-            usdt_balance = next((float(asset['free']) for asset in account.get('balances', []) if asset['asset'] == 'USDT'), 0)
+            usdt_balance = self.get_usdt()
 
             if usdt_balance > 10:
-                raw_qty = Decimal(str(usdt_balance)) * Decimal('0.03') / Decimal(str(price))
+                raw_qty = usdt_balance * 0.03 / price
                 symbol_info = self.get_symbol_info(symbol)
                 if symbol_info is None:
-                    self.logger.warning(f"No symbol info for {symbol}, skipping trade")
+                    self.logger.warning("No symbol info for %s, skipping trade", symbol)
                     return
-                step = symbol_info['stepSize']
-                qty = float((raw_qty // step) * step)
+                qty = self.quantize_qty_int(raw_qty, symbol_info.step_int, symbol_info.step_scale)
 
-                if (Decimal(str(qty)) * Decimal(str(price))) > Decimal('10'):
-                    order = self.safe_order(self.client.order_market_buy, symbol=symbol, quantity=str(qty))
-                    if not order:
-                        self.logger.error(f"High volume buy failed for {symbol}")
+                if self._should_place_order(qty, price, symbol_info):
+                    buy_price = self._execute_buy(symbol, price, qty, f'High volume opportunity (Score: {score:.1f})',
+                                                  1 + self.config.PROFIT_TARGET * 2,
+                                                  1 - self.config.STOP_LOSS)
+                    if buy_price is None:
                         return
 
-                    buy_price = float(order.get('fills', [])[0].get('price')) if order.get('fills') else price
-
-                    order_info = {
-                        'order_id': order.get('orderId'),
-                        'symbol': symbol,
-                        'side': 'BUY',
-                        'type': 'MARKET',
-                        'quantity': qty,
-                        'price': buy_price,
-                        'status': order.get('status'),
-                        'timestamp': datetime.now(),
-                        'reason': f'High volume opportunity (Score: {score:.1f})',
-                        'bot': self.name
-                    }
-
-                    self.orders.append(order_info)
-
-                    self.positions.append({
-                        'symbol': symbol,
-                        'entry_price': buy_price,
-                        'quantity': qty,
-                        'entry_time': datetime.now(),
-                        'take_profit': buy_price * (1 + self.config.PROFIT_TARGET * 2),
-                        'stop_loss': buy_price * (1 - self.config.STOP_LOSS)
-                    })
+                    with self._cache_lock:
+                        self.trading_symbols.add(symbol)
 
-                    self.trading_symbols.add(symbol)
-
-                    self.logger.info(f"High volume purchase: {symbol} at {buy_price}, Score: {score:.1f}")
+                    self.logger.info("High volume purchase: %s at %s, Score: %.1f", symbol, buy_price, score)
 
         except Exception as e:
-            self.logger.error(f"Error placing high volume buy: {e}")
+            self.logger.error("Error placing high volume buy: %s", e)
 
     def check_high_volume_positions(self):
+        try:
+            prices = self.get_prices({p['symbol'] for p in self.positions})
+        except Exception as e:
+            self.logger.error("Error fetching prices for positions: %s", e)
+            return
+
         for position in self.positions[:]:
             try:
-                current_price = float(self.client.get_symbol_ticker(symbol=position['symbol'])['price'])
+                current_price = prices.get(position['symbol'])
+                if current_price is None:
+                    continue
 
                 if current_price >= position['take_profit']:
                     self.place_high_volume_sell(position, "Take profit")
@@ -393,52 +605,41 @@ class HighVolumeBot(BaseBot):
                     self.place_high_volume_sell(position, "Take loss")
 
             except Exception as e:
-                self.logger.error(f"Error checking high volume position: {e}")
+                self.logger.error("Error checking high volume position: %s", e)
 
     def place_high_volume_sell(self, position, reason):
         try:
-            order = self.safe_order(self.client.order_market_sell, symbol=position['symbol'], quantity=str(position['quantity']))
-            if not order:
-                self.logger.error(f"High volume sell failed for {position.get('symbol')}")
+            result = self._execute_sell(position, reason)
+            if result is None:
                 return
+            sell_price, profit = result
 
-            sell_price = float(order.get('fills', [])[0].get('price')) if order.get('fills') else 0
-            profit = (sell_price - position['entry_price']) * position['quantity']
-
-            order_info = {
-                'order_id': order.get('orderId'),
-                'symbol': position['symbol'],
-                'side': 'SELL',
-                'type': 'MARKET',
-                'quantity': position['quantity'],
-                'price': sell_price,
-                'status': order.get('status'),
-                'timestamp': datetime.now(),
-                'reason': reason,
-                'profit': profit,
-                'bot': self.name
-            }
-
-            self.orders.append(order_info)
-            self.positions.remove(position)
-            self.trading_symbols.discard(position['symbol'])
+            with self._cache_lock:
+                self.trading_symbols.discard(position['symbol'])
 
-            self.logger.info(f"High volume sale: {position['symbol']}, Profit: {profit:.4f}")
+            self.logger.info("High volume sale: %s, Profit: %.4f", position['symbol'], profit)
 
         except Exception as e:
-            self.logger.error(f"Error selling high volume position: {e}")
+            self.logger.error("Error selling high volume position: %s", e)
 
 
 class MultiBotManager:
     def __init__(self, config):
         self.config = config
-        # create client for testnet and ensure API URL for python-binance compatibility
-        self.client = Client(config.BINANCE_API_KEY, config.BINANCE_API_SECRET, testnet=True)
-        try:
-            self.client.API_URL = getattr(config, 'TESTNET_API_URL', 'https://testnet.binance.vision/api')
-        except Exception:
-            pass
+        # one process-wide testnet client (pooled keep-alive session) shared by every bot
+        self.client = get_client()
         self.bots = {}
+        # bounded pool for per-symbol analysis: no thread per event, caps concurrent REST calls
+        self.executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='bot')
+        self.balance_bot = None
+        # one event loop thread drives every bot's periodic poll (see schedule)
+        self._loop = None
+        self._poll_tasks = {}
+        self.twm = None
+        self.price_cache = {}  # symbol -> (price, time received), fed by the miniticker stream
+        self._subscribers = []
+        # set whenever a bot publishes an event; lets consumers sleep until something changes
+        self.state_changed = threading.Event()
         self.setup_logging()
 
     def setup_logging(self):
@@ -446,7 +647,7 @@ class MultiBotManager:
         import os
         os.makedirs('logs', exist_ok=True)
         logging.basicConfig(
-            level=logging.INFO,
+            level=self.config.LOG_LEVEL.upper(),
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
                 logging.FileHandler('logs/multi_bot.log'),
@@ -458,31 +659,152 @@ class MultiBotManager:
     def initialize_bots(self):
         try:
             from trading_bot import ScalpingTradingBot
-            # ScalpingTradingBot handles its own client internally (ok to pass config only)
-            self.bots['scalping'] = ScalpingTradingBot(self.config)
+            self.bots['scalping'] = ScalpingTradingBot(self.config, self.client)
         except Exception as e:
-            self.logger.error(f"Could not import ScalpingTradingBot: {e}")
+            self.logger.error("Could not import ScalpingTradingBot: %s", e)
 
         self.bots['new_listing'] = NewListingBot(self.config, self.client)
         self.bots['high_volume'] = HighVolumeBot(self.config, self.client)
 
-        self.logger.info(f"Bots initialized: {list(self.bots.keys())}")
+        for bot in self.bots.values():
+            bot.manager = self
+            bot.executor = self.executor
+
+        # all bots share one account, so any bot that can report balances will do
+        self.balance_bot = next((b for b in self.bots.values() if hasattr(b, 'get_account_balance')), None)
+
+        self.logger.info("Bots initialized: %s", list(self.bots.keys()))
+
+    def start_price_stream(self):
+        """Keep price_cache warm from the !miniTicker@arr stream (one push per second for all symbols)"""
+        if self.twm is not None:
+            return
+        try:
+            self.twm = ThreadedWebsocketManager(self.config.BINANCE_API_KEY, self.config.BINANCE_API_SECRET,
+                                                testnet=True)
+            self.twm.daemon = True  # never keep the process alive on its own; stop_price_stream closes it
+            self.twm.start()
+            self.twm.start_miniticker_socket(callback=self._on_tickers)
+        except Exception as e:
+            self.logger.error("Could not start miniticker stream, using REST prices: %s", e)
+            self.twm = None
+
+    def stop_price_stream(self):
+        twm, self.twm = self.twm, None
+        if twm is None:
+            return
+        try:
+            twm.stop()
+        except Exception as e:
+            self.logger.error("Error stopping miniticker stream: %s", e)
+        self.price_cache.clear()  # get_prices falls back to REST until the stream restarts
+
+    def _on_tickers(self, msg):
+        if isinstance(msg, dict):
+            if msg.get('e') == 'error':
+                self.logger.error("Miniticker stream error: %s", msg)
+            return
+        now = time.time()
+        for ticker in msg:
+            self.price_cache[ticker['s']] = (float(ticker['c']), now)
+
+    def get_prices(self, symbols):
+        """Latest prices for symbols: fresh websocket entries, else a single batched get_all_tickers()"""
+        now = time.time()
+        prices = {}
+        stale = []
+        for symbol in symbols:
+            entry = self.price_cache.get(symbol)
+            if entry and now - entry[1] < PRICE_STALE_AFTER:
+                prices[symbol] = entry[0]
+            else:
+                stale.append(symbol)
+
+        if stale:
+            tickers = {t['symbol']: float(t['price']) for t in self.client.get_all_tickers()}
+            for symbol in stale:
+                if symbol in tickers:
+                    prices[symbol] = tickers[symbol]
+
+        return prices
+
+    def _ensure_loop(self):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, name='bot-scheduler', daemon=True).start()
+        return self._loop
+
+    def schedule(self, bot):
+        """Poll bot every bot.poll_interval seconds on the shared loop (no dedicated sleeping thread)"""
+        task = self._poll_tasks.get(bot.name)
+        if task is not None and not task.done():
+            return
+        self._poll_tasks[bot.name] = asyncio.run_coroutine_threadsafe(self._run_periodic(bot), self._ensure_loop())
+
+    def unschedule(self, bot):
+        """Cancel bot's poll task; its aclose() still runs on the loop"""
+        task = self._poll_tasks.pop(bot.name, None)
+        if task is not None:
+            task.cancel()
+
+    async def _run_periodic(self, bot):
+        loop = asyncio.get_running_loop()
+        try:
+            while bot.running:
+                if asyncio.iscoroutinefunction(bot.poll):
+                    await bot.poll()
+                else:
+                    # blocking REST work runs on the pool; the loop itself only sleeps and dispatches
+                    await loop.run_in_executor(self.executor, bot.poll)
+                await asyncio.sleep(bot.poll_interval)
+        finally:
+            await bot.aclose()
+
+    def subscribe(self, callback):
+        """Register callback(event, payload) for bot events ('order_placed', 'stats_changed')"""
+        self._subscribers.append(callback)
+
+    def publish(self, event, payload=None):
+        for callback in self._subscribers:
+            try:
+                callback(event, payload)
+            except Exception as e:
+                self.logger.error("Error in %s subscriber: %s", event, e)
+        self.state_changed.set()
+
+    def forward_orders_to_socketio(self, message_queue):
+        """Emit new orders straight to dashboard clients through a socketio message queue
+
+        Works from any process (bot runner or dashboard worker) because the emit goes
+        through the broker rather than an in-process server.
+        """
+        from flask_socketio import SocketIO
+        external_sio = SocketIO(message_queue=message_queue)
+
+        def forward(event, payload):
+            if event == 'order_placed':
+                external_sio.emit('orders_update', [payload])
+
+        self.subscribe(forward)
 
     def start_all_bots(self):
+        # the price stream only runs while bots do, so status tools never open a websocket
+        self.start_price_stream()
         for name, bot in self.bots.items():
             try:
                 bot.start()
-                self.logger.info(f"Started {name}")
+                self.logger.info("Started %s", name)
             except Exception as e:
-                self.logger.error(f"Error starting {name}: {e}")
+                self.logger.error("Error starting %s: %s", name, e)
 
     def stop_all_bots(self):
         for name, bot in self.bots.items():
             try:
                 bot.stop()
-                self.logger.info(f"Stopped {name}")
+                self.logger.info("Stopped %s", name)
             except Exception as e:
-                self.logger.error(f"Error stopping {name}: {e}")
+                self.logger.error("Error stopping %s: %s", name, e)
+        self.stop_price_stream()
 
     def get_all_stats(self):
         stats = {}
@@ -490,18 +812,28 @@ class MultiBotManager:
             try:
                 stats[name] = bot.get_stats()
             except Exception as e:
-                self.logger.error(f"Error getting stats for {name}: {e}")
+                self.logger.error("Error getting stats for %s: %s", name, e)
                 stats[name] = {'name': name, 'error': str(e)}
 
         return stats
 
-    def get_all_orders(self):
-        all_orders = []
+    def get_all_orders(self, limit=None):
+        """All orders across bots, newest first; limit bounds the work to the first `limit` rows
+
+        Each bot appends chronologically, so its reversed history is already sorted and a
+        k-way heap merge (O(N log k)) replaces a full sort.
+        """
+        histories = []
         for bot in self.bots.values():
             try:
-                all_orders.extend(bot.orders)
+                # snapshot (at most `limit` rows) so appends from bot threads can't break the merge
+                histories.append(list(itertools.islice(reversed(bot.orders), limit)))
             except Exception as e:
-                self.logger.error(f"Error getting orders: {e}")
+                self.logger.error("Error getting orders: %s", e)
+
+        merged = heapq.merge(*histories, key=lambda o: o.get('timestamp_ns', 0), reverse=True)
+        return list(itertools.islice(merged, limit))
 
-        all_orders.sort(key=lambda x: x.get('timestamp', datetime.min), reverse=True)
-        return all_orders
+    def get_recent_orders(self, n):
+        """Newest n orders across all bots, newest first"""
+        return self.get_all_orders(limit=n)
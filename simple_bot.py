@@ -1,15 +1,18 @@
 # simple_bot.py
 import logging
 import time
-from datetime import datetime
+from collections import deque
 from binance.client import Client
 from binance import ThreadedWebsocketManager
 
 class SimpleTestBot:
+    MONITOR_INTERVAL = 10  # seconds between price checks
+    SAMPLE_EVERY = 60  # seconds between monitoring log lines
+
     def __init__(self, config):
         self.config = config
         self.client = Client(config.BINANCE_API_KEY, config.BINANCE_API_SECRET, testnet=True)
-        self.orders = []
+        self.orders = deque(maxlen=config.MAX_ORDER_HISTORY)
         self.running = False
         self.logger = logging.getLogger('SimpleBot')
         
@@ -52,6 +55,8 @@ class SimpleTestBot:
         
         def monitor():
             order_placed = False
+            log_every = max(self.SAMPLE_EVERY // self.MONITOR_INTERVAL, 1)
+            ticks = 0
             
             while self.running:
                 try:
@@ -59,7 +64,9 @@ class SimpleTestBot:
                     ticker = self.client.get_symbol_ticker(symbol=self.config.SYMBOL)
                     current_price = float(ticker['price'])
                     
-                    self.logger.info(f"📊 Monitoring {self.config.SYMBOL}: ${current_price:.2f}")
+                    if ticks % log_every == 0:
+                        self.logger.info("📊 Monitoring %s: $%.2f", self.config.SYMBOL, current_price)
+                    ticks += 1
                     
                     # Place a test order (only once)
                     if not order_placed and self.running:
@@ -67,9 +74,9 @@ class SimpleTestBot:
                         order_placed = True
                     
                 except Exception as e:
-                    self.logger.error(f"Monitoring error: {e}")
+                    self.logger.error("Monitoring error: %s", e)
                 
-                time.sleep(10)
+                time.sleep(self.MONITOR_INTERVAL)
         
         thread = threading.Thread(target=monitor)
         thread.daemon = True
@@ -107,7 +114,7 @@ class SimpleTestBot:
                 'quantity': float(order['executedQty']),
                 'price': current_price,
                 'status': order['status'],
-                'timestamp': datetime.now(),
+                'timestamp_ns': time.time_ns(),
                 'reason': 'Test order',
                 'bot': 'SimpleBot'
             }
@@ -147,7 +154,7 @@ class SimpleTestBot:
                 'quantity': float(order['executedQty']),
                 'price': current_price,
                 'status': order['status'],
-                'timestamp': datetime.now(),
+                'timestamp_ns': time.time_ns(),
                 'reason': 'Test sell',
                 'profit': profit,
                 'bot': 'SimpleBot'
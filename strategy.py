@@ -1,65 +1,267 @@
-import pandas as pd
+import logging
+import math
 import numpy as np
-from typing import Dict
+from typing import Dict, NamedTuple, Optional
 import talib
+import talib.stream
+from config import STRATEGY_PARAMS
+from strategy_kernel import score, HOLD, BUY, SELL, NEUTRAL, UPTREND, DOWNTREND
+
+# closes kept for TA-Lib / batch use; the live indicators only need the streaming state
+HISTORY_LEN = 256
+# Bollinger bands are not configurable: 20 closes, 2 standard deviations
+BB_PERIOD = 20
+BB_NBDEV = 2.0
+
+# strategy_kernel codes -> the names/reasons generate_signal reports
+_ACTION_NAMES = {HOLD: 'HOLD', BUY: 'BUY', SELL: 'SELL'}
+_TREND_NAMES = {NEUTRAL: 'NEUTRAL', UPTREND: 'UPTREND', DOWNTREND: 'DOWNTREND'}
+_REASONS = {
+    (UPTREND, BUY): 'Uptrend buy dip',
+    (UPTREND, SELL): 'Uptrend take profit',
+    (DOWNTREND, SELL): 'Downtrend sell rally',
+    (DOWNTREND, BUY): 'Downtrend cautious buy',
+    (NEUTRAL, BUY): 'Range buy',
+    (NEUTRAL, SELL): 'Range sell',
+}
+
+
+class Indicators(NamedTuple):
+    """Indicator values for the latest bar"""
+    ema_short: float
+    ema_long: float
+    rsi: float
+    macd: float
+    macd_signal: float
+    macd_hist: float
+    bb_upper: float
+    bb_middle: float
+    bb_lower: float
+
+
+def precompute_indicators(closes, params=STRATEGY_PARAMS) -> Dict[str, np.ndarray]:
+    """Full indicator arrays for a whole close series, aligned with it (NaN during warm-up)
+
+    One TA-Lib call per indicator, so a backtest indexes ind['rsi'][i] per bar
+    instead of recomputing over a window. Keys match the Indicators fields.
+    """
+    ema_short_p, ema_long_p, macd_fast, macd_slow, macd_signal_p, rsi_period = params
+    closes = np.asarray(closes, dtype=np.float64)
+    macd, macd_signal, macd_hist = talib.MACD(closes, fastperiod=macd_fast, slowperiod=macd_slow,
+                                              signalperiod=macd_signal_p)
+    bb_upper, bb_middle, bb_lower = talib.BBANDS(closes, timeperiod=BB_PERIOD,
+                                                 nbdevup=BB_NBDEV, nbdevdn=BB_NBDEV)
+    return {
+        'ema_short': talib.EMA(closes, timeperiod=ema_short_p),
+        'ema_long': talib.EMA(closes, timeperiod=ema_long_p),
+        'rsi': talib.RSI(closes, timeperiod=rsi_period),
+        'macd': macd,
+        'macd_signal': macd_signal,
+        'macd_hist': macd_hist,
+        'bb_upper': bb_upper,
+        'bb_middle': bb_middle,
+        'bb_lower': bb_lower
+    }
+
+
+def determine_trend_vec(ema_short, ema_long, macd, macd_signal, rsi):
+    """Trend codes (strategy_kernel NEUTRAL/UPTREND/DOWNTREND) for whole indicator arrays
+
+    Same scoring as determine_trend without per-bar branches, for backtests.
+    Ties and NaN count as bearish, exactly like the scalar comparisons.
+    """
+    trend_score = (np.where(ema_short > ema_long, 1.0, -1.0)
+                   + np.where(macd > macd_signal, 1.0, -1.0)
+                   + np.where(rsi > 50, 0.5, -0.5))
+    return np.where(trend_score >= 1.5, UPTREND, np.where(trend_score <= -1.5, DOWNTREND, NEUTRAL))
+
+
+def _last(result):
+    """Value of a talib.stream call: a plain value before TA-Lib 0.8, a stream object with .value after"""
+    return getattr(result, 'value', result)
+
+
+class _EMA:
+    """EMA updated one close at a time, seeded with the SMA of the first `period` closes (as TA-Lib)"""
+    __slots__ = ('period', 'alpha', 'value', '_n', '_sum')
+
+    def __init__(self, period):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value = None
+        self._n = 0
+        self._sum = 0.0
+
+    def update(self, x):
+        if self.value is not None:
+            self.value += self.alpha * (x - self.value)
+        else:
+            self._n += 1
+            self._sum += x
+            if self._n == self.period:
+                self.value = self._sum / self.period
+        return self.value
+
+
+class _RSI:
+    """Wilder RSI from running average gain/loss"""
+    __slots__ = ('period', 'value', '_prev', '_n', '_gain', '_loss')
+
+    def __init__(self, period):
+        self.period = period
+        self.value = None
+        self._prev = None
+        self._n = 0
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def update(self, x):
+        prev, self._prev = self._prev, x
+        if prev is None:
+            return None
+        change = x - prev
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        p = self.period
+        if self._n < p:
+            # seed: plain average of the first `period` changes
+            self._n += 1
+            self._gain += gain
+            self._loss += loss
+            if self._n < p:
+                return None
+            self._gain /= p
+            self._loss /= p
+        else:
+            self._gain = (self._gain * (p - 1) + gain) / p
+            self._loss = (self._loss * (p - 1) + loss) / p
+        total = self._gain + self._loss
+        self.value = 100.0 * self._gain / total if total else 0.0
+        return self.value
+
+
+class _Bands:
+    """Bollinger bands over the last `period` closes from a running sum / sum of squares"""
+    __slots__ = ('period', 'nbdev', 'value', '_buf', '_i', '_n', '_sum', '_sumsq')
+
+    def __init__(self, period, nbdev):
+        self.period = period
+        self.nbdev = nbdev
+        self.value = None  # (upper, middle, lower)
+        self._buf = np.zeros(period)
+        self._i = 0
+        self._n = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    def update(self, x):
+        buf, i, p = self._buf, self._i, self.period
+        old = float(buf[i])
+        buf[i] = x
+        self._sum += x - old
+        self._sumsq += x * x - old * old
+        i += 1
+        if i == p:
+            # once per lap, resync the sums so float drift cannot build up
+            i = 0
+            self._sum = float(buf.sum())
+            self._sumsq = float(buf @ buf)
+        self._i = i
+        if self._n < p:
+            self._n += 1
+            if self._n < p:
+                return None
+        mean = self._sum / p
+        dev = self.nbdev * math.sqrt(max(self._sumsq / p - mean * mean, 0.0))
+        self.value = (mean + dev, mean, mean - dev)
+        return self.value
+
 
 class IntelligentScalpingStrategy:
-    def __init__(self, config):
+    def __init__(self, config, logger=None):
         self.config = config
+        self.logger = logger or logging.getLogger(__name__)
         self.position = None
         self.trend = 'NEUTRAL'
-        self.price_data = []  # list of {'timestamp': ts, 'close': price}
+        # close history as parallel ring buffers: head is the next slot, n the filled count
+        self.closes = np.empty(HISTORY_LEN, dtype=np.float64)
+        self.ts = np.empty(HISTORY_LEN, dtype=np.int64)
+        self.head = 0
+        self.n = 0
+        self.params = config.strategy_params
 
-    def calculate_indicators(self, prices: list) -> Dict:
-        """Calculate technical indicators for intelligent decision making"""
-        if len(prices) < self.config.EMA_LONG:
-            return {}
+        # streaming state, advanced once per close in update_price_data
+        ema_short_p, ema_long_p, macd_fast, macd_slow, macd_signal_p, rsi_period = self.params
+        self._ema_short = _EMA(ema_short_p)
+        self._ema_long = _EMA(ema_long_p)
+        self._macd_fast = _EMA(macd_fast)
+        self._macd_slow = _EMA(macd_slow)
+        # TA-Lib seeds MACD's fast EMA late so both EMAs produce their first value on the same bar
+        self._macd_fast_start = max(macd_slow - macd_fast, 0)
+        self._macd_signal = _EMA(macd_signal_p)
+        self._rsi = _RSI(rsi_period)
+        self._bands = _Bands(BB_PERIOD, BB_NBDEV)
+        self._macd = None
+        self.count = 0  # closes seen since start
+        # bound once: the per-close update is then plain local calls
+        self._price_updaters = (self._ema_short.update, self._ema_long.update,
+                                self._rsi.update, self._bands.update)
+        # closes needed before every streaming indicator has a value
+        self.warmup = max(ema_long_p, macd_slow + macd_signal_p - 1, rsi_period + 1, BB_PERIOD)
 
-        closes = pd.Series(prices).astype(float).values
+    def calculate_indicators(self, prices: list = None) -> Optional[Indicators]:
+        """Calculate technical indicators for intelligent decision making
+
+        Without `prices` this reads the streaming state kept current by
+        update_price_data (O(1)); with a price list (e.g. self.history())
+        it runs TA-Lib over it. None until there is enough history.
+        """
+        if prices is None:
+            return self._streaming_indicators()
+
+        # below warmup TA-Lib has no value yet for the slowest indicator (MACD: slow + signal - 1 bars)
+        if len(prices) < self.warmup:
+            return None
+
+        ema_short_p, ema_long_p, macd_fast, macd_slow, macd_signal_p, rsi_period = self.params
+
+        # no copy for a float64 array such as self.history()
+        closes = np.asarray(prices, dtype=np.float64)
 
         try:
-            ema_short = talib.EMA(closes, timeperiod=self.config.EMA_SHORT)[-1]
-            ema_long = talib.EMA(closes, timeperiod=self.config.EMA_LONG)[-1]
-            rsi = talib.RSI(closes, timeperiod=self.config.RSI_PERIOD)[-1]
-            macd, macd_signal, macd_hist = talib.MACD(
+            # talib.stream computes only the last bar instead of a full output array
+            ema_short = _last(talib.stream.EMA(closes, timeperiod=ema_short_p))
+            ema_long = _last(talib.stream.EMA(closes, timeperiod=ema_long_p))
+            rsi = _last(talib.stream.RSI(closes, timeperiod=rsi_period))
+            macd_val, macd_signal_val, macd_hist_val = _last(talib.stream.MACD(
                 closes,
-                fastperiod=self.config.MACD_FAST,
-                slowperiod=self.config.MACD_SLOW,
-                signalperiod=self.config.MACD_SIGNAL
-            )
-            macd_val = macd[-1] if macd.size > 0 else 0
-            macd_signal_val = macd_signal[-1] if macd_signal.size > 0 else 0
-            macd_hist_val = macd_hist[-1] if macd_hist.size > 0 else 0
-            bb_upper, bb_middle, bb_lower = talib.BBANDS(closes, timeperiod=20, nbdevup=2, nbdevdn=2)
-
-            return {
-                'ema_short': float(ema_short),
-                'ema_long': float(ema_long),
-                'rsi': float(rsi),
-                'macd': float(macd_val),
-                'macd_signal': float(macd_signal_val),
-                'macd_hist': float(macd_hist_val),
-                'bb_upper': float(bb_upper[-1]),
-                'bb_middle': float(bb_middle[-1]),
-                'bb_lower': float(bb_lower[-1])
-            }
+                fastperiod=macd_fast,
+                slowperiod=macd_slow,
+                signalperiod=macd_signal_p
+            ))
+            bb_upper, bb_middle, bb_lower = _last(talib.stream.BBANDS(
+                closes, timeperiod=BB_PERIOD, nbdevup=BB_NBDEV, nbdevdn=BB_NBDEV))
+
+            return Indicators(float(ema_short), float(ema_long), float(rsi),
+                              float(macd_val), float(macd_signal_val), float(macd_hist_val),
+                              float(bb_upper), float(bb_middle), float(bb_lower))
         except Exception as e:
-            print(f"[Indicator Error] {e}")
-            return {}
+            self.logger.error("Indicator error: %s", e)
+            return None
 
-    def determine_trend(self, indicators: Dict) -> str:
-        if not indicators:
+    def determine_trend(self, indicators: Optional[Indicators]) -> str:
+        if indicators is None:
             return 'NEUTRAL'
         trend_score = 0
-        if indicators['ema_short'] > indicators['ema_long']:
+        if indicators.ema_short > indicators.ema_long:
             trend_score += 1
         else:
             trend_score -= 1
-        if indicators['macd'] > indicators['macd_signal']:
+        if indicators.macd > indicators.macd_signal:
             trend_score += 1
         else:
             trend_score -= 1
-        if indicators['rsi'] > 50:
+        if indicators.rsi > 50:
             trend_score += 0.5
         else:
             trend_score -= 0.5
@@ -70,30 +272,48 @@ class IntelligentScalpingStrategy:
         else:
             return 'NEUTRAL'
 
-    def generate_signal(self, current_price: float, indicators: Dict) -> Dict:
+    def generate_signal(self, current_price: float, indicators: Optional[Indicators]) -> Dict:
         signal = {'action': 'HOLD', 'confidence': 0, 'reason': '', 'price': current_price}
-        if not indicators:
+        if indicators is None:
             return signal
-        trend = self.determine_trend(indicators)
-        self.trend = trend
-        if trend == 'UPTREND':
-            if current_price <= indicators['bb_lower'] and indicators['rsi'] < 35:
-                signal.update({'action': 'BUY', 'confidence': 0.8, 'reason': 'Uptrend buy dip'})
-            elif current_price >= indicators['bb_upper'] and indicators['rsi'] > 70:
-                signal.update({'action': 'SELL', 'confidence': 0.7, 'reason': 'Uptrend take profit'})
-        elif trend == 'DOWNTREND':
-            if current_price >= indicators['bb_upper'] and indicators['rsi'] > 65:
-                signal.update({'action': 'SELL', 'confidence': 0.75, 'reason': 'Downtrend sell rally'})
-            elif current_price <= indicators['bb_lower'] and indicators['rsi'] < 30:
-                signal.update({'action': 'BUY', 'confidence': 0.6, 'reason': 'Downtrend cautious buy'})
-        else:
-            if current_price <= indicators['bb_lower'] and indicators['rsi'] < 30:
-                signal.update({'action': 'BUY', 'confidence': 0.7, 'reason': 'Range buy'})
-            elif current_price >= indicators['bb_upper'] and indicators['rsi'] > 70:
-                signal.update({'action': 'SELL', 'confidence': 0.7, 'reason': 'Range sell'})
+        action, confidence, trend = score(
+            current_price, indicators.ema_short, indicators.ema_long, indicators.rsi,
+            indicators.macd, indicators.macd_signal,
+            indicators.bb_upper, indicators.bb_middle, indicators.bb_lower)
+        self.trend = _TREND_NAMES[trend]
+        if action != HOLD:
+            signal.update({'action': _ACTION_NAMES[action], 'confidence': confidence,
+                           'reason': _REASONS[trend, action]})
         return signal
 
+    def _streaming_indicators(self) -> Optional[Indicators]:
+        if self.count < self.warmup:
+            return None
+        macd, macd_signal = self._macd, self._macd_signal.value
+        return Indicators(self._ema_short.value, self._ema_long.value, self._rsi.value,
+                          macd, macd_signal, macd - macd_signal, *self._bands.value)
+
+    def history(self) -> np.ndarray:
+        """Stored closes, oldest first; a view until the ring wraps, then one concatenated copy"""
+        head = self.head
+        if self.n < HISTORY_LEN or head == 0:
+            return self.closes[:self.n]
+        return np.concatenate((self.closes[head:], self.closes[:head]))
+
     def update_price_data(self, price: float, timestamp: int):
-        self.price_data.append({'timestamp': timestamp, 'close': price})
-        if len(self.price_data) > 100:
-            self.price_data = self.price_data[-50:]
+        price = float(price)
+        head = self.head
+        self.closes[head] = price
+        self.ts[head] = timestamp
+        self.head = (head + 1) % HISTORY_LEN
+        if self.n < HISTORY_LEN:
+            self.n += 1
+
+        self.count += 1
+        for update in self._price_updaters:
+            update(price)
+        fast = self._macd_fast.update(price) if self.count > self._macd_fast_start else None
+        slow = self._macd_slow.update(price)
+        if fast is not None and slow is not None:
+            self._macd = fast - slow
+            self._macd_signal.update(self._macd)
@@ -0,0 +1,50 @@
+# strategy_kernel.py
+"""Fused trend + signal scoring for IntelligentScalpingStrategy, JIT-compiled with numba when installed"""
+import os
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: the same function runs as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+HOLD, BUY, SELL = 0, 1, 2
+NEUTRAL, UPTREND, DOWNTREND = 0, 1, 2
+
+
+# no fastmath: TA-Lib inputs can be NaN during warm-up and must compare False
+@njit(cache=True)
+def score(price, ema_s, ema_l, rsi, macd, macd_sig, bb_u, bb_m, bb_l):
+    """(action, confidence, trend) codes for one bar; bb_m is accepted for a stable signature"""
+    trend_score = 1.0 if ema_s > ema_l else -1.0
+    trend_score += 1.0 if macd > macd_sig else -1.0
+    trend_score += 0.5 if rsi > 50 else -0.5
+
+    if trend_score >= 1.5:
+        if price <= bb_l and rsi < 35:
+            return BUY, 0.8, UPTREND
+        if price >= bb_u and rsi > 70:
+            return SELL, 0.7, UPTREND
+        return HOLD, 0.0, UPTREND
+    if trend_score <= -1.5:
+        if price >= bb_u and rsi > 65:
+            return SELL, 0.75, DOWNTREND
+        if price <= bb_l and rsi < 30:
+            return BUY, 0.6, DOWNTREND
+        return HOLD, 0.0, DOWNTREND
+    if price <= bb_l and rsi < 30:
+        return BUY, 0.7, NEUTRAL
+    if price >= bb_u and rsi > 70:
+        return SELL, 0.7, NEUTRAL
+    return HOLD, 0.0, NEUTRAL
+
+
+# ahead-of-time build from compile_kernels.py: no JIT stall on the first closed kline.
+# MINA_NO_AOT=1 keeps the numba versions (compile_kernels.py sets it to export them).
+if not os.getenv('MINA_NO_AOT'):
+    try:
+        from mina_kernels import score  # noqa: F811
+    except ImportError:
+        pass
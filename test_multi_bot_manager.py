@@ -0,0 +1,72 @@
+# test_multi_bot_manager.py
+"""Bot bookkeeping that runs across the scheduler loop and the worker pool"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from config import get_config
+from multi_bot_manager import BaseBot, HighVolumeBot
+
+
+class StubAsyncClient:
+    """get_ticker / get_historical_klines with a per-symbol failure switch"""
+
+    def __init__(self, volumes):
+        self.volumes = volumes
+        self.failing = set()
+        self.kline_calls = []
+
+    async def get_ticker(self):
+        return [{'symbol': s, 'volume': str(v), 'priceChangePercent': '1'} for s, v in self.volumes.items()]
+
+    async def get_historical_klines(self, symbol, interval, start):
+        self.kline_calls.append(symbol)
+        if symbol in self.failing:
+            raise RuntimeError("APIError(code=-1003): Too many requests")
+        return [[0, 0, 0, 0, 0, 100.0]] * 48
+
+
+def _bot(aclient):
+    bot = HighVolumeBot(get_config(), client=None)
+    bot.aclient = aclient
+    return bot
+
+
+def test_failed_klines_fetch_is_retried_next_cycle():
+    aclient = StubAsyncClient({'AAAUSDT': 1000.0, 'BBBUSDT': 2000.0})
+    aclient.failing.add('BBBUSDT')
+    bot = _bot(aclient)
+
+    asyncio.run(bot.analyze_high_volume_coins())
+    assert sorted(aclient.kline_calls) == ['AAAUSDT', 'BBBUSDT']
+    assert 'BBBUSDT' not in bot._prev_volume
+
+    aclient.failing.clear()
+    aclient.kline_calls.clear()
+    asyncio.run(bot.analyze_high_volume_coins())
+    # AAA's volume has not moved, so only the symbol that failed is fetched again
+    assert aclient.kline_calls == ['BBBUSDT']
+    assert bot._prev_volume == {'AAAUSDT': 1000.0, 'BBBUSDT': 2000.0}
+
+
+def test_delisted_symbols_leave_the_volume_baseline():
+    aclient = StubAsyncClient({'AAAUSDT': 1000.0, 'BBBUSDT': 2000.0})
+    bot = _bot(aclient)
+
+    asyncio.run(bot.analyze_high_volume_coins())
+    del aclient.volumes['BBBUSDT']
+    asyncio.run(bot.analyze_high_volume_coins())
+
+    assert bot._prev_volume == {'AAAUSDT': 1000.0}
+
+
+def test_record_keeps_stats_exact_under_concurrent_workers():
+    bot = BaseBot("StatsBot", get_config(), client=None)
+    order = {'status': 'FILLED', 'profit': 0.5}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(4000):
+            pool.submit(bot._record, dict(order))
+
+    stats = bot.get_stats()
+    assert (stats['total_trades'], stats['winning_trades']) == (4000, 4000)
+    assert stats['total_profit'] == 2000.0
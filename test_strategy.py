@@ -0,0 +1,55 @@
+# test_strategy.py
+"""Streaming indicators must agree with TA-Lib's full-series functions on every bar"""
+import numpy as np
+import talib
+
+from config import get_config
+from strategy import IntelligentScalpingStrategy, precompute_indicators
+
+
+def _random_walk(n=600, seed=0):
+    return 60000 + np.cumsum(np.random.default_rng(seed).normal(0, 50, n))
+
+
+def test_streaming_macd_matches_talib_from_first_bar():
+    config = get_config()
+    closes = _random_walk()
+    macd, signal, hist = talib.MACD(closes, fastperiod=config.MACD_FAST, slowperiod=config.MACD_SLOW,
+                                    signalperiod=config.MACD_SIGNAL)
+    strategy = IntelligentScalpingStrategy(config)
+
+    checked = 0
+    for i, price in enumerate(closes):
+        strategy.update_price_data(price, i)
+        ind = strategy.calculate_indicators()
+        if ind is None:
+            continue
+        np.testing.assert_allclose((ind.macd, ind.macd_signal, ind.macd_hist),
+                                   (macd[i], signal[i], hist[i]), rtol=0, atol=1e-8)
+        checked += 1
+
+    assert checked == len(closes) - strategy.warmup + 1
+
+
+def test_streaming_indicators_match_precomputed_arrays():
+    closes = _random_walk(seed=1)
+    arrays = precompute_indicators(closes)
+    strategy = IntelligentScalpingStrategy(get_config())
+
+    for i, price in enumerate(closes):
+        strategy.update_price_data(price, i)
+        ind = strategy.calculate_indicators()
+        if ind is None:
+            continue
+        for name, value in ind._asdict().items():
+            np.testing.assert_allclose(value, arrays[name][i], rtol=1e-9, atol=1e-6, err_msg=f"{name} @ {i}")
+
+
+def test_price_list_below_warmup_returns_none_quietly(caplog):
+    strategy = IntelligentScalpingStrategy(get_config())
+    closes = _random_walk()
+
+    for n in range(strategy.warmup):
+        assert strategy.calculate_indicators(closes[:n]) is None
+    assert strategy.calculate_indicators(closes[:strategy.warmup]) is not None
+    assert not [r for r in caplog.records if r.levelname == 'ERROR']
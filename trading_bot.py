@@ -1,21 +1,36 @@
 # trading_bot.py (updated for multi-bot compatibility)
-import logging
 from binance.client import Client
 from binance import ThreadedWebsocketManager
-import json
 import time
-from datetime import datetime
-from decimal import Decimal, ROUND_DOWN
 from strategy import IntelligentScalpingStrategy
 from config import Config
+from binance_client import get_client
 from multi_bot_manager import BaseBot
 
 class ScalpingTradingBot(BaseBot):
-    def __init__(self, config: Config):
-        super().__init__("ScalpingBot", config, None)
-        self.client = Client(config.BINANCE_API_KEY, config.BINANCE_API_SECRET, testnet=True)
+    def __init__(self, config: Config, client: Client = None):
+        super().__init__("ScalpingBot", config, client or get_client())
         self.twm = None
-        self.strategy = IntelligentScalpingStrategy(config)
+        self.strategy = IntelligentScalpingStrategy(config, self.logger)
+        # closed klines needed before the strategy has indicators; skip signal work until then
+        self._warmup = self.strategy.warmup
+        self._ready = False
+        # account balance, refetched at most every _balance_ttl seconds or after a fill
+        self._balance_cache = None
+        self._balance_ts = 0.0
+        self._balance_ttl = 5.0
+        self._balance_assets = frozenset((config.BASE_ASSET, config.QUOTE_ASSET))
+        # quantities are rounded down to 0.00001: (step_int, step_scale) for quantize_qty_int
+        self._qty_step = (1, 100000)
+        # per-order price multipliers, fixed for the bot's lifetime
+        self._sl_mult = 1 - config.STOP_LOSS
+        self._tp_mult = 1 + config.PROFIT_TARGET
+        self._buy_slip = 1.001  # limit buy slightly above the close
+        self._sell_slip = 0.999  # limit sell slightly below it
+        # exit levels of the newest position, mirrored from self.positions for the per-kline check
+        self._has_position = False
+        self._sl_price = 0.0
+        self._tp_price = 0.0
         
     def start_trading(self):
         """Start the trading bot"""
@@ -34,6 +49,7 @@ class ScalpingTradingBot(BaseBot):
         )
         
         self.logger.info("Trading bot started successfully")
+        self.notify('stats_changed')
     
     def stop_trading(self):
         """Stop the trading bot"""
@@ -41,6 +57,7 @@ class ScalpingTradingBot(BaseBot):
         self.running = False
         if self.twm:
             self.twm.stop()
+        self.notify('stats_changed')
     
     def start(self):
         """Start bot (BaseBot compatibility)"""
@@ -61,16 +78,23 @@ class ScalpingTradingBot(BaseBot):
     
     def get_account_balance(self):
         """Get current account balance"""
+        if self._balance_cache is not None and time.monotonic() - self._balance_ts < self._balance_ttl:
+            return self._balance_cache
         try:
             account = self.client.get_account()
-            self.balance = {
-                asset['asset']: {
-                    'free': float(asset['free']),
-                    'locked': float(asset['locked'])
-                }
-                for asset in account['balances']
-                if asset['asset'] in [self.config.BASE_ASSET, self.config.QUOTE_ASSET]
-            }
+            wanted = self._balance_assets
+            balance = {}
+            for asset in account['balances']:
+                if asset['asset'] in wanted:
+                    balance[asset['asset']] = {
+                        'free': float(asset['free']),
+                        'locked': float(asset['locked'])
+                    }
+                    if len(balance) == len(wanted):
+                        break
+            self.balance = balance
+            self._balance_cache = self.balance
+            self._balance_ts = time.monotonic()
             return self.balance
         except Exception as e:
             self.logger.error(f"Error getting account balance: {e}")
@@ -88,9 +112,7 @@ class ScalpingTradingBot(BaseBot):
                 max_investment / price,
                 self.config.MAX_POSITION_SIZE
             )
-            return float(Decimal(str(calculated_quantity)).quantize(
-                Decimal('0.00001'), rounding=ROUND_DOWN
-            ))
+            return self.quantize_qty_int(calculated_quantity, *self._qty_step)
         
         return self.config.QUANTITY
     
@@ -104,12 +126,12 @@ class ScalpingTradingBot(BaseBot):
                 return False
             
             # Place limit order slightly above current price
-            buy_price = round(price * 1.001, 2)
+            buy_price = round(price * self._buy_slip, 2)
             
             order = self.client.order_limit_buy(
                 symbol=self.config.SYMBOL,
                 quantity=quantity,
-                price=str(buy_price)
+                price=f'{buy_price:.2f}'
             )
             
             order_info = {
@@ -120,23 +142,28 @@ class ScalpingTradingBot(BaseBot):
                 'quantity': float(order['origQty']),
                 'price': float(order['price']),
                 'status': order['status'],
-                'timestamp': datetime.now(),
                 'reason': reason,
                 'bot': self.name
             }
             
-            self.orders.append(order_info)
+            self._balance_ts = 0  # funds moved into the order
+            self._record(order_info)
             self.logger.info(f"BUY order placed: {order_info}")
             
             # Store position information
+            stop_loss = buy_price * self._sl_mult
+            take_profit = buy_price * self._tp_mult
             self.positions.append({
                 'symbol': self.config.SYMBOL,
                 'entry_price': buy_price,
                 'quantity': quantity,
-                'entry_time': datetime.now(),
-                'stop_loss': buy_price * (1 - self.config.STOP_LOSS),
-                'take_profit': buy_price * (1 + self.config.PROFIT_TARGET)
+                'entry_time_ns': time.time_ns(),
+                'stop_loss': stop_loss,
+                'take_profit': take_profit
             })
+            self._has_position = True
+            self._sl_price = stop_loss
+            self._tp_price = take_profit
             
             return True
             
@@ -155,12 +182,12 @@ class ScalpingTradingBot(BaseBot):
             quantity = current_position['quantity']
             
             # Place limit order slightly below current price
-            sell_price = round(price * 0.999, 2)
+            sell_price = round(price * self._sell_slip, 2)
             
             order = self.client.order_limit_sell(
                 symbol=self.config.SYMBOL,
                 quantity=quantity,
-                price=str(sell_price)
+                price=f'{sell_price:.2f}'
             )
             
             profit = (sell_price - current_position['entry_price']) * quantity
@@ -173,17 +200,22 @@ class ScalpingTradingBot(BaseBot):
                 'quantity': float(order['origQty']),
                 'price': float(order['price']),
                 'status': order['status'],
-                'timestamp': datetime.now(),
                 'reason': reason,
                 'profit': profit,
                 'bot': self.name
             }
             
-            self.orders.append(order_info)
+            self._balance_ts = 0
+            self._record(order_info)
             self.logger.info(f"SELL order placed: {order_info}")
             
             # Remove position
             self.positions.pop()
+            if self.positions:
+                self._sl_price = self.positions[-1]['stop_loss']
+                self._tp_price = self.positions[-1]['take_profit']
+            else:
+                self._has_position = False
             
             return True
             
@@ -206,12 +238,15 @@ class ScalpingTradingBot(BaseBot):
                     
                     # Update strategy with new price
                     self.strategy.update_price_data(current_price, timestamp)
+                    if not self._ready:
+                        if self.strategy.count < self._warmup:
+                            return
+                        self._ready = True
+
+                    # Indicators were advanced incrementally by update_price_data
+                    indicators = self.strategy.calculate_indicators()
                     
-                    # Calculate indicators
-                    prices = [p['close'] for p in self.strategy.price_data]
-                    indicators = self.strategy.calculate_indicators(prices)
-                    
-                    if indicators:
+                    if indicators is not None:
                         # Generate trading signal
                         signal = self.strategy.generate_signal(current_price, indicators)
                         
@@ -226,41 +261,30 @@ class ScalpingTradingBot(BaseBot):
                         
                         # Check for stop loss and take profit
                         self.check_position_management(current_price)
+
+                    self.notify('stats_changed')
                     
         except Exception as e:
             self.logger.error(f"Error handling socket message: {e}")
     
     def check_position_management(self, current_price: float):
         """Check stop loss and take profit for current position"""
-        if not self.positions:
+        if not self._has_position:
             return
         
-        position = self.positions[-1]
-        
         # Check stop loss
-        if current_price <= position['stop_loss']:
+        if current_price <= self._sl_price:
             self.logger.warning(f"Stop loss triggered at {current_price}")
             self.place_sell_order(current_price, "Stop loss triggered")
         
         # Check take profit
-        elif current_price >= position['take_profit']:
+        elif current_price >= self._tp_price:
             self.logger.info(f"Take profit triggered at {current_price}")
             self.place_sell_order(current_price, "Take profit triggered")
     
     def get_stats(self):
         """Get trading statistics"""
-        filled_orders = [o for o in self.orders if o['status'] == 'FILLED']
-        total_trades = len(filled_orders)
-        winning_trades = len([o for o in filled_orders if o.get('profit', 0) > 0])
-        total_profit = sum([o.get('profit', 0) for o in filled_orders])
-        
-        return {
-            'name': self.name,
-            'total_trades': total_trades,
-            'winning_trades': winning_trades,
-            'total_profit': total_profit,
-            'win_rate': winning_trades / total_trades if total_trades > 0 else 0,
-            'current_positions': len(self.positions),
-            'running': self.running,
-            'symbol': self.config.SYMBOL
-        }
+        # BaseBot keeps the FILLED/win/profit totals up to date in _record
+        stats = super().get_stats()
+        stats['symbol'] = self.config.SYMBOL
+        return stats
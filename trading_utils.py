@@ -0,0 +1,30 @@
+# trading_utils.py
+"""Order helpers shared by the debug script and the dashboard"""
+from decimal import Decimal, ROUND_DOWN
+from functools import lru_cache
+
+from binance_cache import cached_ticker
+from binance_client import get_client
+
+
+@lru_cache(maxsize=64)
+def get_tick_size(symbol) -> Decimal:
+    """PRICE_FILTER tick size for symbol; symbol filters rarely change, so cache per process"""
+    info = get_client().get_symbol_info(symbol)
+    filters = {f['filterType']: f for f in info.get('filters', [])}
+    return Decimal(filters['PRICE_FILTER']['tickSize'])
+
+
+def quantize_to_tick(price, tick: Decimal) -> Decimal:
+    p = Decimal(str(price))
+    if tick == 0:
+        return p
+    return (p / tick).to_integral_value(rounding=ROUND_DOWN) * tick
+
+
+def place_test_limit_buy(symbol, offset_ratio, quantity=0.001):
+    """Place a limit buy at offset_ratio * current price (far from market, so it should not fill)"""
+    client = get_client()
+    current_price = float(cached_ticker(client, symbol)['price'])
+    price = quantize_to_tick(current_price * offset_ratio, get_tick_size(symbol))
+    return client.order_limit_buy(symbol=symbol, quantity=quantity, price=str(price))
@@ -0,0 +1,42 @@
+# volume_kernels.py
+"""Numeric kernels for HighVolumeBot, JIT-compiled with numba when it is installed"""
+import os
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: the same functions run as plain NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def volume_score(volumes, volume, price_change):
+    """Score a symbol from its hourly volumes (>= 24 bars), 24h volume and 24h % change"""
+    avg_volume = volumes[-168:].mean()
+    if avg_volume == 0:
+        return 0.0
+
+    ratio_score = min(volume / avg_volume * 20, 50.0)
+    momentum_score = abs(price_change) * 2
+    consistency_score = min(volumes[-24:].std() / avg_volume * 100, 30.0)
+
+    return ratio_score + momentum_score + (30 - consistency_score)
+
+
+@njit(cache=True, fastmath=True)
+def is_volume_breakout(closes, volumes, spike_threshold):
+    """Last close > 2% above SMA20 and last volume > spike_threshold x its SMA20"""
+    sma_20 = closes[-20:].mean()
+    volume_sma = volumes[-20:].mean()
+    return closes[-1] > sma_20 * 1.02 and volumes[-1] > volume_sma * spike_threshold
+
+
+# ahead-of-time build from compile_kernels.py: no JIT stall on the first scoring cycle.
+# MINA_NO_AOT=1 keeps the numba versions (compile_kernels.py sets it to export them).
+if not os.getenv('MINA_NO_AOT'):
+    try:
+        from mina_kernels import volume_score, is_volume_breakout  # noqa: F811
+    except ImportError:
+        pass